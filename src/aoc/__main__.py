@@ -1,156 +1,164 @@
 import argparse
-from importlib.resources import files
+import json
+import sys
+from pathlib import Path
 from timeit import default_timer as timer
 
-from aoc import (
-    day_1,
-    day_2,
-    day_3,
-    day_4,
-    day_5,
-    day_6,
-    day_7,
-    day_8,
-    day_9,
-    day_10,
-    day_11,
-    day_12,
-    day_13,
-    day_14,
-    day_15,
-    day_16,
-    day_17,
-    day_18,
-    day_19,
-    day_20,
-    day_21,
-    day_22,
-    day_23,
-    day_24,
-    day_25,
-)
-from aoc.utils import contents
-
-parser = argparse.ArgumentParser(prog="AOC", description="Advent of Code")
-parser.add_argument("day", help="The day to run.")
-parser.add_argument(
-    "-t", "--test", action="store_true", help="Whether to use the test or real input."
-)
-
-args = parser.parse_args()
-
-# Get the file contents
-filename = "test.txt" if args.test else "input.txt"
-path = files("aoc.inputs") / args.day / filename
-puzzle = contents.get_puzzle_input(path)
-start_time = timer()
-
-match args.day:
-    case "day_1":
-        part_1 = day_1.part_1(puzzle)
-        middle_time = timer()
-        part_2 = day_1.part_2(puzzle)
-    case "day_2":
-        part_1 = day_2.part_1(puzzle)
-        middle_time = timer()
-        part_2 = day_2.part_2(puzzle)
-    case "day_3":
-        part_1 = day_3.part_1(puzzle)
-        middle_time = timer()
-        part_2 = day_3.part_2(puzzle)
-    case "day_4":
-        part_1 = day_4.part_1(puzzle)
-        middle_time = timer()
-        part_2 = day_4.part_2(puzzle)
-    case "day_5":
-        part_1 = day_5.part_1(puzzle)
-        middle_time = timer()
-        part_2 = day_5.part_2(puzzle)
-    case "day_6":
-        part_1 = day_6.part_1(puzzle)
-        middle_time = timer()
-        part_2 = day_6.part_2(puzzle)
-    case "day_7":
-        part_1 = day_7.part_1(puzzle)
-        middle_time = timer()
-        part_2 = day_7.part_2(puzzle)
-    case "day_8":
-        part_1 = day_8.part_1(puzzle)
-        middle_time = timer()
-        part_2 = day_8.part_2(puzzle)
-    case "day_9":
-        part_1 = day_9.part_1(puzzle)
-        middle_time = timer()
-        part_2 = day_9.part_2(puzzle)
-    case "day_10":
-        part_1 = day_10.part_1(puzzle)
-        middle_time = timer()
-        part_2 = day_10.part_2(puzzle)
-    case "day_11":
-        part_1 = day_11.part_1(puzzle)
-        middle_time = timer()
-        part_2 = day_11.part_2(puzzle)
-    case "day_12":
-        part_1 = day_12.part_1(puzzle)
-        middle_time = timer()
-        part_2 = day_12.part_2(puzzle)
-    case "day_13":
-        part_1 = day_13.part_1(puzzle)
-        middle_time = timer()
-        part_2 = day_13.part_2(puzzle)
-    case "day_14":
-        part_1 = day_14.part_1(puzzle)
-        middle_time = timer()
-        part_2 = day_14.part_2(puzzle)
-    case "day_15":
-        part_1 = day_15.part_1(puzzle)
-        middle_time = timer()
-        part_2 = day_15.part_2(puzzle)
-    case "day_16":
-        part_1 = day_16.part_1(puzzle)
-        middle_time = timer()
-        part_2 = day_16.part_2(puzzle)
-    case "day_17":
-        part_1 = day_17.part_1(puzzle)
-        middle_time = timer()
-        part_2 = day_17.part_2(puzzle)
-    case "day_18":
-        part_1 = day_18.part_1(puzzle)
-        middle_time = timer()
-        part_2 = day_18.part_2(puzzle)
-    case "day_19":
-        part_1 = day_19.part_1(puzzle)
-        middle_time = timer()
-        part_2 = day_19.part_2(puzzle)
-    case "day_20":
-        part_1 = day_20.part_1(puzzle)
-        middle_time = timer()
-        part_2 = day_20.part_2(puzzle)
-    case "day_21":
-        part_1 = day_21.part_1(puzzle)
-        middle_time = timer()
-        part_2 = day_21.part_2(puzzle)
-    case "day_22":
-        part_1 = day_22.part_1(puzzle)
-        middle_time = timer()
-        part_2 = day_22.part_2(puzzle)
-    case "day_23":
-        part_1 = day_23.part_1(puzzle)
-        middle_time = timer()
-        part_2 = day_23.part_2(puzzle)
-    case "day_24":
-        part_1 = day_24.part_1(puzzle)
-        middle_time = timer()
-        part_2 = day_24.part_2(puzzle)
-    case _:
-        raise ValueError("Unknown day!")
-
-end_time = timer()
-
-print("Part 1:")
-print(part_1)
-print("Time taken:", round(middle_time - start_time, 3), "seconds")
-print()
-print("Part 2:")
-print(part_2)
-print("Time taken:", round(end_time - middle_time, 3), "seconds")
+from aoc.utils import registry, runner
+
+
+def print_result(result: runner.DayResult) -> None:
+    print("Import time:", round(result.import_time, 3), "seconds")
+    print("Parse time:", round(result.parse_time, 3), "seconds")
+    print()
+    print("Part 1:")
+    print(result.part_1)
+    print("Time taken:", round(result.part_1_time, 3), "seconds")
+    print()
+    print("Part 2:")
+    print(result.part_2)
+    print("Time taken:", round(result.part_2_time, 3), "seconds")
+    if result.cached:
+        print()
+        print("Answers from the result cache")
+
+
+def print_report(results: list[runner.DayResult], wall_time: float) -> None:
+    print(f"{'Day':<8} {'Part 1':>20} {'Part 2':>20} {'Time':>10}")
+    for result in results:
+        if result.error is not None:
+            print(f"{result.day:<8} {'FAILED':>20}")
+            continue
+        time = "cached" if result.cached else f"{result.total_time:.3f}s"
+        print(
+            f"{result.day:<8} {str(result.part_1):>20} {str(result.part_2):>20}"
+            f" {time:>10}"
+        )
+    print()
+    print("Total solve time:", round(sum(r.total_time for r in results), 3), "seconds")
+    print("Wall time:", round(wall_time, 3), "seconds")
+
+    for result in results:
+        if result.error is not None:
+            print()
+            print(f"{result.day} failed:")
+            print(result.error)
+
+
+def main() -> None:
+    if sys.argv[1:2] == ["bench"]:
+        from aoc.utils import bench
+
+        sys.exit(bench.main(sys.argv[2:]))
+    if sys.argv[1:2] == ["gen"]:
+        from aoc import gen
+
+        sys.exit(gen.main(sys.argv[2:]))
+
+    parser = argparse.ArgumentParser(prog="AOC", description="Advent of Code")
+    parser.add_argument("days", nargs="*", help="The day(s) to run.")
+    parser.add_argument(
+        "-t",
+        "--test",
+        action="store_true",
+        help="Whether to use the test or real input.",
+    )
+    parser.add_argument(
+        "-a", "--all", action="store_true", help="Run every day in parallel."
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=None, help="Number of worker processes."
+    )
+    parser.add_argument(
+        "--mmap", action="store_true", help="Memory-map the input file."
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Use a day's streaming mode, for days that have one.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always solve, don't use or update the result cache.",
+    )
+    instrument = parser.add_mutually_exclusive_group()
+    instrument.add_argument(
+        "--profile",
+        action="store_true",
+        help="Run each part under cProfile and report the hot functions.",
+    )
+    instrument.add_argument(
+        "--memory",
+        action="store_true",
+        help="Report the peak traced memory and top allocation sites per part.",
+    )
+    parser.add_argument(
+        "--profile-dir",
+        default="profiles",
+        help="Where to write the .pstats (and .collapsed) files.",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=15,
+        help="How many functions (or allocation sites) to report.",
+    )
+    parser.add_argument(
+        "--collapsed",
+        action="store_true",
+        help="Also write collapsed stacks for flamegraph tools.",
+    )
+    parser.add_argument(
+        "--report", default=None, help="Also write the results to this JSON file."
+    )
+
+    args = parser.parse_args()
+    days = registry.available_days() if args.all else args.days
+    if len(days) == 0:
+        parser.error("Give at least one day, or --all.")
+
+    if args.profile or args.memory:
+        from aoc.utils.profiling import MemoryTracer, Profiler
+
+        # Instrument the days one after the other, in this process
+        results = []
+        for day in days:
+            day = registry.normalize_day(day)
+            hook: runner.PhaseHook
+            if args.profile:
+                hook = Profiler(day, Path(args.profile_dir), args.top, args.collapsed)
+            else:
+                hook = MemoryTracer(day, args.top)
+            results.append(
+                runner.solve_day(day, args.test, args.mmap, hook, args.stream)
+            )
+            print_result(results[-1])
+        return
+
+    cache = None if args.no_cache else runner.default_cache()
+    if len(days) == 1 and not args.all:
+        results = [runner.run_day(days[0], args.test, args.mmap, cache, args.stream)]
+        print_result(results[0])
+    else:
+        start_time = timer()
+        results = runner.run_days(
+            days, args.test, args.jobs, args.mmap, cache, args.stream
+        )
+        print_report(results, timer() - start_time)
+
+    if cache is not None:
+        cache.save()
+        print()
+        print(
+            f"Cache: {cache.hits} hits, {cache.misses} misses this run"
+            f" ({cache.lifetime_hits} hits, {cache.lifetime_misses} misses total)"
+        )
+
+    if args.report is not None:
+        with open(args.report, "w") as file:
+            json.dump(runner.to_json(results), file, indent=2, default=str)
+
+
+if __name__ == "__main__":
+    main()
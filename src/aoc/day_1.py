@@ -1,4 +1,9 @@
-from aoc.utils.contents import PuzzleInput
+from typing import Any
+
+from aoc.utils.contents import PuzzleInput, PuzzleStream
+from aoc.utils.parallel import map_reduce
+
+STREAMING = True
 
 
 def get_input(filename: str = "input.txt") -> list[str]:
@@ -6,16 +11,26 @@ def get_input(filename: str = "input.txt") -> list[str]:
         return file.readlines()
 
 
-def part_1(puzzle: PuzzleInput) -> int:
-    contents = puzzle.lines
-    rolling_sum = 0
-    for line in contents:
-        line = line.strip()
-        digits = [x for x in line if x.isdigit()]
-        numbers = "".join([digits[0], digits[-1]])
-        num = int(numbers)
-        rolling_sum += num
-    return rolling_sum
+ZERO = ord("0")
+# Every byte but the digits and line breaks
+NOT_DIGITS = bytes(c for c in range(256) if c not in b"0123456789\n")
+
+
+def chunk_calibration(chunk: bytes) -> int:
+    # Once everything else is deleted a line is only its digits, so the first
+    # and last bytes are the ones we want
+    lines = chunk.translate(None, NOT_DIGITS).split()
+    if len(lines) != sum(1 for line in chunk.splitlines() if line.strip()):
+        raise ValueError("line without a digit in it")
+    total = 0
+    for line in lines:
+        total += (line[0] - ZERO) * 10 + line[-1] - ZERO
+    return total
+
+
+def part_1(puzzle: PuzzleInput | PuzzleStream) -> int:
+    # Whole chunks of lines at a time, so the workers get worthwhile batches
+    return map_reduce(chunk_calibration, puzzle.chunks())
 
 
 NUMBERS = [
@@ -31,39 +46,79 @@ NUMBERS = [
     "nine",
 ]
 
+# Marks the end of a word in a trie node, with the digit it stands for
+END = None
+
+Trie = dict[Any, Any]
+
 
-def replace(line: str) -> str:
-    low_index = {}
-    for n, number in enumerate(NUMBERS):
-        cur_index = line.find(number)
-        if cur_index != -1:
-            low_index[cur_index] = (n, number)
+def build_trie(words: dict[bytes, int]) -> Trie:
+    trie: Trie = {}
+    for word, value in words.items():
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[END] = value
+    return trie
 
-    high_index = {}
-    for n, number in enumerate(NUMBERS):
-        cur_index = line.rfind(number)
-        if cur_index != -1:
-            high_index[cur_index] = (n, number)
 
-    if len(low_index) > 0:
-        lowest = min(low_index.keys())
-        line = line[:lowest] + str(low_index[lowest][0]) + line[lowest:]
+SPELLED_DIGITS = build_trie(
+    {
+        **{str(n).encode(): n for n in range(10)},
+        **{word.encode(): n for n, word in enumerate(NUMBERS)},
+    }
+)
 
-    if len(high_index) > 0:
-        highest = max(high_index.keys())
-        line = line[: highest + 1] + str(high_index[highest][0]) + line[highest + 1 :]
 
-    return line
+def match_from(line: bytes, start: int, node: Trie) -> int | None:
+    # Carry on down the trie from a node that already matched line[:start]
+    for i in range(start, len(line)):
+        child: Trie | None = node.get(line[i])
+        if child is None:
+            return None
+        if END in child:
+            return int(child[END])
+        node = child
+    return None
 
 
-def part_2(puzzle: PuzzleInput) -> int:
-    contents = puzzle.lines
-    rolling_sum = 0
-    for line in contents:
+def first_digit(line: bytes, trie: Trie) -> int:
+    for start, char in enumerate(line):
+        node = trie.get(char)
+        if node is None:
+            continue
+        if END in node:
+            return int(node[END])
+        if (digit := match_from(line, start + 1, node)) is not None:
+            return digit
+    raise ValueError(f"No digit in {line!r}")
+
+
+def last_digit(line: bytes, trie: Trie) -> int:
+    # The match starting furthest right, even if an earlier one overlaps it
+    for start in range(len(line) - 1, -1, -1):
+        node = trie.get(line[start])
+        if node is None:
+            continue
+        if END in node:
+            return int(node[END])
+        if (digit := match_from(line, start + 1, node)) is not None:
+            return digit
+    raise ValueError(f"No digit in {line!r}")
+
+
+def spelled_calibration_value(line: bytes) -> int:
+    return first_digit(line, SPELLED_DIGITS) * 10 + last_digit(line, SPELLED_DIGITS)
+
+
+def chunk_spelled_calibration(chunk: bytes) -> int:
+    total = 0
+    for line in chunk.split(b"\n"):
         line = line.strip()
-        line = replace(line)
-        digits = [x for x in line if x.isdigit()]
-        numbers = "".join([digits[0], digits[-1]])
-        num = int(numbers)
-        rolling_sum += num
-    return rolling_sum
+        if len(line) > 0:
+            total += spelled_calibration_value(line)
+    return total
+
+
+def part_2(puzzle: PuzzleInput | PuzzleStream) -> int:
+    return map_reduce(chunk_spelled_calibration, puzzle.chunks())
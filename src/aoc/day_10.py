@@ -1,74 +1,48 @@
-from typing import Any
+from typing import Any, NamedTuple
 
-from aoc.utils.common import Coord
 from aoc.utils.contents import PuzzleInput
+from aoc.utils.grid import Grid
 
+# Pipes that connect to each side of a tile: north, east, south, west
+CONNECTS = (b"|F7", b"-J7", b"|JL", b"-LF")
+EDGE = ord("#")
 
-def get_start(puzzle: list[str]) -> Coord:
-    y = 0
-    for line in puzzle:
-        if line.find("S") != -1:
-            return Coord(line.find("S"), y)
-        y += 1
-    raise ValueError()
+
+class PipeMap(NamedTuple):
+    layout: Grid
+    pipe: list[int]
+
+
+def get_start(grid: Grid) -> int:
+    return grid.find("S")
 
 
-def get_start_neightbors(start: Coord, puzzle: list[str]) -> tuple[Coord, Coord]:
-    neighbors: list[Coord] = []
-    left_coord = Coord(start.x - 1, start.y)
-    left = puzzle[start.y][start.x - 1]
-    if left in "-LF":
-        neighbors.append(left_coord)
-    right_coord = Coord(start.x + 1, start.y)
-    right = puzzle[start.y][start.x + 1]
-    if right in "-J7":
-        neighbors.append(right_coord)
-    top_coord = Coord(start.x, start.y - 1)
-    top = puzzle[start.y - 1][start.x]
-    if top in "|F7":
-        neighbors.append(top_coord)
-    bottom_coord = Coord(start.x, start.y + 1)
-    bottom = puzzle[start.y + 1][start.x]
-    if bottom in "|JL":
-        neighbors.append(bottom_coord)
+def get_start_neightbors(start: int, grid: Grid) -> tuple[int, int]:
+    neighbors: list[int] = []
+    for offset, pipes in zip(grid.orthogonal, CONNECTS):
+        if grid[start + offset] in pipes:
+            neighbors.append(start + offset)
 
     assert len(neighbors) == 2
     return (neighbors[0], neighbors[1])
 
 
-def next_pipe(current: Coord, previous: Coord, puzzle: list[str]) -> Coord:
-    neighbors: list[Coord]
-    match puzzle[current.y][current.x]:
+def next_pipe(current: int, previous: int, grid: Grid) -> int:
+    north, east, south, west = grid.orthogonal
+    neighbors: list[int]
+    match chr(grid[current]):
         case "|":
-            neighbors = [
-                Coord(current.x, current.y - 1),
-                Coord(current.x, current.y + 1),
-            ]
+            neighbors = [current + north, current + south]
         case "-":
-            neighbors = [
-                Coord(current.x - 1, current.y),
-                Coord(current.x + 1, current.y),
-            ]
+            neighbors = [current + west, current + east]
         case "L":
-            neighbors = [
-                Coord(current.x, current.y - 1),
-                Coord(current.x + 1, current.y),
-            ]
+            neighbors = [current + north, current + east]
         case "J":
-            neighbors = [
-                Coord(current.x, current.y - 1),
-                Coord(current.x - 1, current.y),
-            ]
+            neighbors = [current + north, current + west]
         case "7":
-            neighbors = [
-                Coord(current.x, current.y + 1),
-                Coord(current.x - 1, current.y),
-            ]
+            neighbors = [current + south, current + west]
         case "F":
-            neighbors = [
-                Coord(current.x, current.y + 1),
-                Coord(current.x + 1, current.y),
-            ]
+            neighbors = [current + south, current + east]
         case _:
             raise ValueError()
 
@@ -77,13 +51,13 @@ def next_pipe(current: Coord, previous: Coord, puzzle: list[str]) -> Coord:
     return neighbors[0]
 
 
-def get_path(start: Coord, puzzle: list[str]) -> list[Coord]:
-    neighbors = get_start_neightbors(start, puzzle)
+def get_path(start: int, grid: Grid) -> list[int]:
+    neighbors = get_start_neightbors(start, grid)
     cur_pipe = neighbors[0]
     last_pipe = start
-    path: list[Coord] = [start, cur_pipe]
+    path: list[int] = [start, cur_pipe]
     while True:
-        following_pipe = next_pipe(cur_pipe, last_pipe, puzzle)
+        following_pipe = next_pipe(cur_pipe, last_pipe, grid)
         if following_pipe == start:
             return path
         path.append(following_pipe)
@@ -92,146 +66,94 @@ def get_path(start: Coord, puzzle: list[str]) -> list[Coord]:
         last_pipe = path[-2]
 
 
-def part_1(puzzle: PuzzleInput) -> Any:
-    start = get_start(puzzle.lines)
-    steps = len(get_path(start, puzzle.lines))
+def prepare(puzzle: PuzzleInput) -> PipeMap:
+    # The border stops the flood fill in part 2 at the edge of the map
+    grid = Grid.from_lines(puzzle.lines, padding=1, sentinel="#")
+    return PipeMap(grid, get_path(get_start(grid), grid))
+
+
+def part_1(pipe_map: PipeMap) -> Any:
+    steps = len(pipe_map.pipe)
     return (steps + 1) // 2
 
 
-def neighbor_fields(loc: Coord, pipe: set[Coord], puzzle: list[str]) -> set[Coord]:
+def neighbor_fields(loc: int, pipe: set[int], grid: Grid) -> set[int]:
     seen = set()
     to_explore = [loc]
     while len(to_explore) > 0:
         current = to_explore.pop()
         seen.add(current)
-        for x in range(-1, 2):
-            for y in range(-1, 2):
-                neighbor = Coord(current.x + x, current.y + y)
-                if neighbor.x < 0 or neighbor.x >= len(puzzle[0]):
-                    continue
-                if neighbor.y < 0 or neighbor.y >= len(puzzle):
-                    continue
-                if neighbor in pipe:
-                    continue
-                if neighbor in seen:
-                    continue
-                to_explore.append(neighbor)
-    return seen
-
-
-def touches_edge(fields: set[Coord], puzzle: list[str]) -> bool:
-    for field in fields:
-        if field.x == 0 or field.x == len(puzzle[0]) - 1:
-            return True
-        if field.y == 0 or field.y == len(puzzle) - 1:
-            return True
-    return False
-
-
-def not_working(puzzle: PuzzleInput) -> Any:
-    start = get_start(puzzle.lines)
-    pipe = set(get_path(start, puzzle.lines))
-    enclosed = set()
-    exposed = set()
-    for y in range(len(puzzle.lines)):
-        for x in range(len(puzzle.lines[0])):
-            current = Coord(x, y)
-            if current in exposed:
+        for offset in grid.adjacent:
+            neighbor = current + offset
+            if grid[neighbor] == EDGE:
                 continue
-            if current in enclosed:
+            if neighbor in pipe:
                 continue
-            if current in pipe:
+            if neighbor in seen:
                 continue
-
-            fields = neighbor_fields(current, pipe, puzzle.lines)
-            if touches_edge(fields, puzzle.lines):
-                exposed.update(fields)
-            else:
-                enclosed.update(fields)
-
-    for x in enclosed:
-        print(x)
-    return len(enclosed)
+            to_explore.append(neighbor)
+    return seen
 
 
-def get_sides(
-    pipe: list[Coord], index: int, puzzle: list[str]
-) -> tuple[list[Coord], list[Coord]]:
-    # Return type is "outside/inside", when going clockwise
-    last_index = (index - 1) % len(pipe)
-    next_index = (index + 1) % len(pipe)
+def get_sides(pipe: list[int], index: int, grid: Grid) -> tuple[list[int], list[int]]:
+    # Return type is "outside/inside", when going clockwise. Indices go up with
+    # y, and with x along a row, so they can be compared like coordinates.
+    north, east, south, west = grid.orthogonal
+    current = pipe[index]
+    last = pipe[(index - 1) % len(pipe)]
+    following = pipe[(index + 1) % len(pipe)]
     # Straight
-    if puzzle[pipe[index].y][pipe[index].x] == "-":
-        up = Coord(pipe[index].x, pipe[index].y - 1)
-        down = Coord(pipe[index].x, pipe[index].y + 1)
+    if grid[current] == ord("-"):
         # left to right
-        if pipe[last_index].x < pipe[next_index].x:
-            return ([up], [down])
+        if last < following:
+            return ([current + north], [current + south])
         # right to left
         else:
-            return ([down], [up])
+            return ([current + south], [current + north])
 
-    if puzzle[pipe[index].y][pipe[index].x] == "|":
-        right = Coord(pipe[index].x + 1, pipe[index].y)
-        left = Coord(pipe[index].x - 1, pipe[index].y)
+    if grid[current] == ord("|"):
         # top to bottom
-        if pipe[last_index].y < pipe[next_index].y:
-            return ([right], [left])
+        if last < following:
+            return ([current + east], [current + west])
         # bottom to top
         else:
-            return ([left], [right])
+            return ([current + west], [current + east])
 
-    if puzzle[pipe[index].y][pipe[index].x] == "J":
-        nook = []
-        edge = [
-            Coord(pipe[index].x + 1, pipe[index].y),
-            Coord(pipe[index].x + 1, pipe[index].y + 1),
-            Coord(pipe[index].x, pipe[index].y + 1),
-        ]
+    if grid[current] == ord("J"):
+        nook: list[int] = []
+        edge = [current + east, current + east + south, current + south]
         # top to left
-        if pipe[last_index].y < pipe[next_index].y:
+        if last < following:
             return (edge, nook)
         # left to top
         else:
             return (nook, edge)
 
-    if puzzle[pipe[index].y][pipe[index].x] == "L":
+    if grid[current] == ord("L"):
         nook = []
-        edge = [
-            Coord(pipe[index].x - 1, pipe[index].y),
-            Coord(pipe[index].x - 1, pipe[index].y + 1),
-            Coord(pipe[index].x, pipe[index].y + 1),
-        ]
+        edge = [current + west, current + west + south, current + south]
         # top to right
-        if pipe[last_index].y < pipe[next_index].y:
+        if last < following:
             return (nook, edge)
         # right to top
         else:
             return (edge, nook)
 
-    if puzzle[pipe[index].y][pipe[index].x] == "F":
+    if grid[current] == ord("F"):
         nook = []
-        edge = [
-            Coord(pipe[index].x - 1, pipe[index].y),
-            Coord(pipe[index].x - 1, pipe[index].y - 1),
-            Coord(pipe[index].x, pipe[index].y - 1),
-        ]
+        edge = [current + west, current + west + north, current + north]
         # bottom to right
-        if pipe[last_index].y > pipe[next_index].y:
+        if last > following:
             return (edge, nook)
         # right to bottom
         else:
             return (nook, edge)
 
-    if puzzle[pipe[index].y][pipe[index].x] == "7":
+    if grid[current] == ord("7"):
         nook = []
-        edge = [
-            Coord(pipe[index].x + 1, pipe[index].y),
-            Coord(pipe[index].x + 1, pipe[index].y - 1),
-            Coord(pipe[index].x, pipe[index].y - 1),
-        ]
+        edge = [current + east, current + east + north, current + north]
         # left to bottom
-        if pipe[last_index].y < pipe[next_index].y:
+        if last < following:
             return (edge, nook)
         # bottom to left
         else:
@@ -240,24 +162,26 @@ def get_sides(
     raise ValueError()
 
 
-def part_2(puzzle: PuzzleInput) -> Any:
-    start = get_start(puzzle.lines)
-    pipe = get_path(start, puzzle.lines)
+def part_2(pipe_map: PipeMap) -> Any:
+    pipe = pipe_map.pipe
     first_side = set()
     second_side = set()
     for i in range(1, len(pipe)):
-        second_sides, first_sides = get_sides(pipe, i, puzzle.lines)
+        second_sides, first_sides = get_sides(pipe, i, pipe_map.layout)
         first_side.update(first_sides)
         second_side.update(second_sides)
 
     inner_sides = first_side if len(first_side) < len(second_side) else second_side
 
-    for inside_field in inner_sides.copy():
-        if inside_field in pipe:
-            inner_sides.remove(inside_field)
+    pipe_fields = set(pipe)
+    inner_sides -= pipe_fields
 
-    all_inside = set()
+    all_inside: set[int] = set()
     for inside_field in inner_sides:
-        all_inside.update(neighbor_fields(inside_field, set(pipe), puzzle.lines))
+        # Most of these are in the same patch, so only flood each patch once
+        if inside_field not in all_inside:
+            all_inside.update(
+                neighbor_fields(inside_field, pipe_fields, pipe_map.layout)
+            )
 
     return len(all_inside)
@@ -2,6 +2,7 @@ import functools
 from typing import Any, NamedTuple
 
 from aoc.utils.contents import PuzzleInput
+from aoc.utils.parallel import map_reduce
 
 
 class Spring(NamedTuple):
@@ -58,11 +59,15 @@ def placements(spring: Spring, next_must_work: bool) -> int:
     raise ValueError("Huh?")
 
 
+def arrangements(spring: Spring) -> int:
+    return placements(spring, False)
+
+
 def part_1(puzzle: PuzzleInput) -> Any:
     springs = parse_input(puzzle.lines)
-    return sum(placements(spring, False) for spring in springs)
+    return map_reduce(arrangements, springs)
 
 
 def part_2(puzzle: PuzzleInput) -> Any:
     springs = parse_input(puzzle.lines, repeats=5)
-    return sum(placements(spring, False) for spring in springs)
+    return map_reduce(arrangements, springs)
@@ -1,36 +1,41 @@
 from typing import Any
 
 from aoc.utils.contents import PuzzleInput
+from aoc.utils.grid import Grid
+from aoc.utils.parallel import map_reduce
 
 
-def parse_input(contents: str) -> list[list[str]]:
+def parse_input(contents: str) -> list[Grid]:
     chunks = contents.split("\n\n")
     patterns = []
     for chunk in chunks:
-        patterns.append([line.strip() for line in chunk.strip().split("\n")])
+        patterns.append(
+            Grid.from_lines(line.strip() for line in chunk.strip().split("\n"))
+        )
     return patterns
 
 
-def mirror(left: str, right: str) -> bool:
-    for left, right in zip(left[::-1], right, strict=False):
-        if left != right:
+def mirror(left: bytes, right: bytes) -> bool:
+    for ours, theirs in zip(left[::-1], right, strict=False):
+        if ours != theirs:
             return False
     return True
 
 
-def smudged_mirror(left: str, right: str) -> int:
+def smudged_mirror(left: bytes, right: bytes) -> int:
     errors = 0
-    for left, right in zip(left[::-1], right, strict=False):
-        if left != right:
+    for ours, theirs in zip(left[::-1], right, strict=False):
+        if ours != theirs:
             errors += 1
     return errors
 
 
-def find_reflection(pattern: list[str]) -> int:
+def find_reflection(pattern: Grid) -> int:
     # Vertical
-    for i in range(1, len(pattern[0])):
+    lines = [row.tobytes() for row in pattern.rows()]
+    for i in range(1, pattern.width):
         works = True
-        for line in pattern:
+        for line in lines:
             if not mirror(line[:i], line[i:]):
                 works = False
                 break
@@ -38,11 +43,10 @@ def find_reflection(pattern: list[str]) -> int:
             return i
 
     # horizontal
-    flipped = list(zip(*pattern))
-    for i in range(1, len(pattern)):
+    flipped = [row.tobytes() for row in pattern.transpose().rows()]
+    for i in range(1, pattern.height):
         works = True
-        for chars in flipped:
-            line = "".join(chars)
+        for line in flipped:
             if not mirror(line[:i], line[i:]):
                 works = False
                 break
@@ -51,32 +55,34 @@ def find_reflection(pattern: list[str]) -> int:
     raise ValueError()
 
 
-def part_1(puzzle: PuzzleInput) -> Any:
-    patterns = parse_input(puzzle.raw)
-    return sum(map(find_reflection, patterns))
+def prepare(puzzle: PuzzleInput) -> list[Grid]:
+    return parse_input(puzzle.raw)
 
 
-def find_reflection_2(pattern: list[str]) -> int:
+def part_1(patterns: list[Grid]) -> Any:
+    return map_reduce(find_reflection, patterns)
+
+
+def find_reflection_2(pattern: Grid) -> int:
     # Vertical
-    for i in range(1, len(pattern[0])):
+    lines = [row.tobytes() for row in pattern.rows()]
+    for i in range(1, pattern.width):
         errors = 0
-        for line in pattern:
+        for line in lines:
             errors += smudged_mirror(line[:i], line[i:])
         if errors == 1:
             return i
 
     # horizontal
-    flipped = list(zip(*pattern))
-    for i in range(1, len(pattern)):
+    flipped = [row.tobytes() for row in pattern.transpose().rows()]
+    for i in range(1, pattern.height):
         errors = 0
-        for chars in flipped:
-            line = "".join(chars)
+        for line in flipped:
             errors += smudged_mirror(line[:i], line[i:])
         if errors == 1:
             return 100 * i
     raise ValueError()
 
 
-def part_2(puzzle: PuzzleInput) -> Any:
-    patterns = parse_input(puzzle.raw)
-    return sum(map(find_reflection_2, patterns))
+def part_2(patterns: list[Grid]) -> Any:
+    return map_reduce(find_reflection_2, patterns)
@@ -2,70 +2,75 @@ import functools
 from typing import Any
 
 from aoc.utils.contents import PuzzleInput
+from aoc.utils.grid import Grid
 
 
-def tilt_line(line: str) -> str:
-    parts = line.split("#")
+def tilt_line(line: bytes) -> bytes:
+    parts = line.split(b"#")
     new_line = []
     for part in parts:
-        new_line.append("O" * part.count("O") + "." * part.count("."))
-    return "#".join(new_line)
+        new_line.append(b"O" * part.count(b"O") + b"." * part.count(b"."))
+    return b"#".join(new_line)
 
 
-def tilt_line_right(line: str) -> str:
-    parts = line.split("#")
+def tilt_line_right(line: bytes) -> bytes:
+    parts = line.split(b"#")
     new_line = []
     for part in parts:
-        new_line.append("." * part.count(".") + "O" * part.count("O"))
-    return "#".join(new_line)
+        new_line.append(b"." * part.count(b".") + b"O" * part.count(b"O"))
+    return b"#".join(new_line)
 
 
-def total_weight(puzzle: list[str]) -> int:
+def tilt(grid: Grid, to_start: bool) -> None:
+    # Rolls the rocks along every row in place. Hand it a transposed grid to
+    # roll them along the columns instead.
+    tilt_func = tilt_line if to_start else tilt_line_right
+    for row in grid.rows():
+        row[:] = tilt_func(row.tobytes())
+
+
+def total_weight(grid: Grid) -> int:
     total = 0
-    for i, weight in enumerate(range(len(puzzle), 0, -1)):
-        total += puzzle[i].count("O") * weight
+    for i, weight in enumerate(range(grid.height, 0, -1)):
+        total += grid.row(i).tobytes().count(b"O") * weight
 
     return total
 
 
 def part_1(puzzle: PuzzleInput) -> Any:
-    rotated: list[str] = ["".join(x) for x in zip(*puzzle.lines)]
-    tilted = list(map(tilt_line, rotated))
-    normal: list[str] = ["".join(x) for x in zip(*tilted)]
-    return total_weight(normal)
+    grid = Grid.from_lines(puzzle.lines)
+    tilt(grid.transpose(), True)
+    return total_weight(grid)
 
 
 @functools.lru_cache(maxsize=None)
-def cycle(puzzle: tuple[str, ...]) -> tuple[str, ...]:
-    # North
-    tilted: list[str] = ["".join(x) for x in zip(*puzzle)]
-    tilted = list(map(tilt_line, tilted))
-    tilted: list[str] = ["".join(x) for x in zip(*tilted)]
+def cycle(cells: bytes, width: int) -> bytes:
+    grid = Grid(bytearray(cells), width, len(cells) // width)
+    columns = grid.transpose()
 
+    # North
+    tilt(columns, True)
     # West
-    tilted = list(map(tilt_line, tilted))
-
+    tilt(grid, True)
     # South
-    tilted: list[str] = ["".join(x) for x in zip(*tilted)]
-    tilted = list(map(tilt_line_right, tilted))
-    tilted: list[str] = ["".join(x) for x in zip(*tilted)]
-
+    tilt(columns, False)
     # East
-    tilted = list(map(tilt_line_right, tilted))
+    tilt(grid, False)
 
-    return tuple(tilted)
+    return bytes(grid.cells)
 
 
 def part_2(puzzle: PuzzleInput) -> Any:
-    layout = tuple(puzzle.lines)
+    grid = Grid.from_lines(puzzle.lines)
+    layout = bytes(grid.cells)
     for _ in range(1000):
-        layout = cycle(layout)
+        layout = cycle(layout, grid.width)
 
     weights = []
     cycles = 999
     while len(weights) < 4 or weights[:2] != weights[-2:]:
-        layout = cycle(layout)
-        weights.append(total_weight(list(layout)))
+        layout = cycle(layout, grid.width)
+        weights.append(total_weight(Grid(bytearray(layout), grid.width, grid.height)))
         cycles += 1
 
     repeating_weights = weights[4:]
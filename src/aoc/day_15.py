@@ -1,7 +1,11 @@
 from collections import OrderedDict, defaultdict
+from collections.abc import Iterable
 from typing import Any
 
-from aoc.utils.contents import PuzzleInput
+from aoc.utils.contents import PuzzleInput, PuzzleStream
+from aoc.utils.parallel import map_reduce
+
+STREAMING = True
 
 
 def aoc_hash(word: str) -> int:
@@ -14,12 +18,12 @@ def aoc_hash(word: str) -> int:
     return current_value
 
 
-def part_1(puzzle: PuzzleInput) -> Any:
-    words = puzzle.lines[0].split(",")
-    return sum(map(aoc_hash, words))
+def part_1(puzzle: PuzzleInput | PuzzleStream) -> Any:
+    words = puzzle.records(",")
+    return map_reduce(aoc_hash, words)
 
 
-def focals(words: list[str]) -> int:
+def focals(words: Iterable[str]) -> int:
     boxes: defaultdict[int, OrderedDict[str, int]] = defaultdict(OrderedDict)
     for word in words:
         if "-" in word:
@@ -39,6 +43,6 @@ def focals(words: list[str]) -> int:
     return total
 
 
-def part_2(puzzle: PuzzleInput) -> Any:
-    words = puzzle.lines[0].split(",")
+def part_2(puzzle: PuzzleInput | PuzzleStream) -> Any:
+    words = puzzle.records(",")
     return focals(words)
@@ -1,129 +1,86 @@
-from enum import Enum, auto
 from typing import Any
 
-from aoc.utils.common import Coord, Direction
 from aoc.utils.contents import PuzzleInput
+from aoc.utils.grid import Grid
 
+# Directions are indices into Grid.orthogonal: north, east, south, west
+NORTH, EAST, SOUTH, WEST = range(4)
+# Where each kind of diagonal mirror sends a beam, by the direction it came in
+DIAG_TL_BR = (WEST, SOUTH, EAST, NORTH)
+DIAG_BL_TR = (EAST, NORTH, WEST, SOUTH)
+EDGE = ord("#")
 
-class Mirror(Enum):
-    DIAG_TL_BR = auto()
-    DIAG_BL_TR = auto()
-    HORIZONTAL = auto()
-    VERTICAL = auto()
-
-
-def parse_input(puzzle: list[str]) -> dict[Coord, Mirror]:
-    positions = {}
-    for y, line in enumerate(puzzle):
-        for x, char in enumerate(line):
-            match char:
-                case "\\":
-                    positions[Coord(x, y)] = Mirror.DIAG_TL_BR
-                case "/":
-                    positions[Coord(x, y)] = Mirror.DIAG_BL_TR
-                case "-":
-                    positions[Coord(x, y)] = Mirror.HORIZONTAL
-                case "|":
-                    positions[Coord(x, y)] = Mirror.VERTICAL
-    return positions
-
-
-def get_energized(
-    puzzle: list[str],
-    mirrors: dict[Coord, Mirror],
-    start: tuple[Coord, Direction] = (Coord(0, 0), Direction.EAST),
-):
-    path: set[tuple[Coord, Direction]] = set()
-    energized: set[Coord] = set()
-    to_explore: list[tuple[Coord, Direction]] = [start]
+
+def get_energized(grid: Grid, start: tuple[int, int]) -> int:
+    path: set[int] = set()
+    energized: set[int] = set()
+    to_explore: list[tuple[int, int]] = [start]
     while len(to_explore) > 0:
         place, direction = to_explore.pop()
         # Check if it's out of bounds
-        if place.x < 0 or place.x >= len(puzzle[0]):
-            continue
-        if place.y < 0 or place.y >= len(puzzle[0]):
+        if grid[place] == EDGE:
             continue
 
         # Check if we've already been here before
-        if (place, direction) in path:
+        state = place * 4 + direction
+        if state in path:
             continue
 
         # Add it to the path / energized set
         energized.add(place)
-        path.add((place, direction))
+        path.add(state)
 
         # Check what the next place to go is
-        if place not in mirrors:
-            to_explore.append((place.add(direction.value), direction))
-            continue
-
-        match mirrors[place]:
-            case Mirror.DIAG_TL_BR:
-                new_direction: Direction
-                match direction:
-                    case Direction.EAST:
-                        new_direction = Direction.SOUTH
-                    case Direction.NORTH:
-                        new_direction = Direction.WEST
-                    case Direction.WEST:
-                        new_direction = Direction.NORTH
-                    case Direction.SOUTH:
-                        new_direction = Direction.EAST
-                to_explore.append((place.add(new_direction.value), new_direction))
-            case Mirror.DIAG_BL_TR:
-                new_direction: Direction
-                match direction:
-                    case Direction.EAST:
-                        new_direction = Direction.NORTH
-                    case Direction.NORTH:
-                        new_direction = Direction.EAST
-                    case Direction.WEST:
-                        new_direction = Direction.SOUTH
-                    case Direction.SOUTH:
-                        new_direction = Direction.WEST
-                to_explore.append((place.add(new_direction.value), new_direction))
-            case Mirror.HORIZONTAL:
-                if direction in {Direction.EAST, Direction.WEST}:
-                    to_explore.append((place.add(direction.value), direction))
+        new_directions: tuple[int, ...]
+        match chr(grid[place]):
+            case ".":
+                new_directions = (direction,)
+            case "\\":
+                new_directions = (DIAG_TL_BR[direction],)
+            case "/":
+                new_directions = (DIAG_BL_TR[direction],)
+            case "-":
+                if direction in (EAST, WEST):
+                    new_directions = (direction,)
                 else:
-                    to_explore.append((place.add(Direction.WEST.value), Direction.WEST))
-                    to_explore.append((place.add(Direction.EAST.value), Direction.EAST))
-            case Mirror.VERTICAL:
-                if direction in {Direction.NORTH, Direction.SOUTH}:
-                    to_explore.append((place.add(direction.value), direction))
+                    new_directions = (WEST, EAST)
+            case "|":
+                if direction in (NORTH, SOUTH):
+                    new_directions = (direction,)
                 else:
-                    to_explore.append(
-                        (place.add(Direction.NORTH.value), Direction.NORTH)
-                    )
-                    to_explore.append(
-                        (place.add(Direction.SOUTH.value), Direction.SOUTH)
-                    )
+                    new_directions = (NORTH, SOUTH)
             case _:
                 raise ValueError()
 
+        for new_direction in new_directions:
+            to_explore.append((place + grid.orthogonal[new_direction], new_direction))
+
     return len(energized)
 
 
-def part_1(puzzle: PuzzleInput) -> Any:
-    mirrors = parse_input(puzzle.lines)
-    return get_energized(puzzle.lines, mirrors)
+def prepare(puzzle: PuzzleInput) -> Grid:
+    # The border is where beams leave the contraption
+    return Grid.from_lines(puzzle.lines, padding=1, sentinel="#")
+
+
+def part_1(grid: Grid) -> Any:
+    return get_energized(grid, (grid.index(0, 0), EAST))
 
 
-def get_max_energized(puzzle: list[str], mirrors: dict[Coord, Mirror]):
+def get_max_energized(grid: Grid) -> int:
     starts = []
-    for y in range(len(puzzle)):
-        starts.append((Coord(0, y), Direction.EAST))
-        starts.append((Coord(len(puzzle[0]) - 1, y), Direction.WEST))
-    for x in range(len(puzzle[0])):
-        starts.append((Coord(x, 0), Direction.SOUTH))
-        starts.append((Coord(x, len(puzzle) - 1), Direction.NORTH))
+    for y in range(grid.height):
+        starts.append((grid.index(0, y), EAST))
+        starts.append((grid.index(grid.width - 1, y), WEST))
+    for x in range(grid.width):
+        starts.append((grid.index(x, 0), SOUTH))
+        starts.append((grid.index(x, grid.height - 1), NORTH))
 
     energized = []
     for start in starts:
-        energized.append(get_energized(puzzle, mirrors, start))
+        energized.append(get_energized(grid, start))
     return max(energized)
 
 
-def part_2(puzzle: PuzzleInput) -> Any:
-    mirrors = parse_input(puzzle.lines)
-    return get_max_energized(puzzle.lines, mirrors)
+def part_2(grid: Grid) -> Any:
+    return get_max_energized(grid)
@@ -1,140 +1,91 @@
 from collections.abc import Iterator
-from enum import IntEnum, auto
-from typing import Any, NamedTuple
+from typing import Any
 
-from aoc.utils.common import a_star
+from aoc.utils.common import lower_bound_table, search
 from aoc.utils.contents import PuzzleInput
+from aoc.utils.grid import Grid
 
+# A state is a cell index times two, plus one if the crucible got there moving
+# vertically
+HORIZONTAL = 0
+VERTICAL = 1
+DIGITS = bytes.maketrans(b"0123456789", bytes(range(10)))
 
-class Direction(IntEnum):
-    HORIZONTAL = auto()
-    VERTICAL = auto()
 
+class Heuristic:
+    def __init__(self, lava_map: Grid, goal: int) -> None:
+        # The heat lost getting to the goal if the crucible could turn anywhere
+        self.table = lower_bound_table(lava_map.cells, lava_map.width, [goal])
 
-class Coord(NamedTuple):
-    x: int
-    y: int
-    direction: Direction
-
-
-def heuristic(current: Coord, goal: Coord) -> float:
-    # Manhattan distance where each step is cost 1
-    height = abs(current.y - goal.y)
-    width = abs(current.x - goal.x)
-    return height + width
+    def __call__(self, current: int) -> float:
+        return self.table[current >> 1]
 
 
 class CostFunction:
-    def __init__(self, lava_map: list[list[int]]) -> None:
+    def __init__(self, lava_map: Grid) -> None:
         self.lava_map = lava_map
 
-    def __call__(self, paths: dict[Coord, Coord], current: Coord, last: Coord) -> float:
+    def __call__(self, paths: dict[int, int], current: int, last: int) -> float:
+        start, end = last >> 1, current >> 1
+        step = self.lava_map.row_step if current & VERTICAL else 1
+        if end < start:
+            step = -step
         total = 0
-        if last.x == current.x:
-            if last.y < current.y:
-                for y in range(last.y + 1, current.y + 1):
-                    total += self.lava_map[y][current.x]
-            else:
-                for y in range(last.y - 1, current.y - 1, -1):
-                    total += self.lava_map[y][current.x]
-        elif last.y == current.y:
-            if last.x < current.x:
-                for x in range(last.x + 1, current.x + 1):
-                    total += self.lava_map[current.y][x]
-            else:
-                for x in range(last.x - 1, current.x - 1, -1):
-                    total += self.lava_map[current.y][x]
-        else:
-            raise ValueError()
+        for i in range(start + step, end + step, step):
+            total += self.lava_map[i]
         return float(total)
 
 
 class NeighborFunction:
-    def __init__(
-        self, lava_map: list[list[int]], min_straight: int, max_straight: int
-    ) -> None:
+    def __init__(self, lava_map: Grid, min_straight: int, max_straight: int) -> None:
         self.lava_map = lava_map
         self.min_straight = min_straight
         self.max_straight = max_straight
 
-    def __call__(self, current: Coord, paths: dict[Coord, Coord]) -> Iterator[Coord]:
+    def __call__(self, current: int, paths: dict[int, int]) -> Iterator[int]:
+        index = current >> 1
+        y, x = divmod(index, self.lava_map.width)
+        row_step = self.lava_map.row_step
         last = paths.get(current)
-        all_neighbors = set()
-        if last:
-            if last.x == current.x:
-                for i in range(self.min_straight, self.max_straight + 1):
-                    all_neighbors.add(
-                        Coord(current.x + i, current.y, Direction.HORIZONTAL)
-                    )
-                    all_neighbors.add(
-                        Coord(current.x - i, current.y, Direction.HORIZONTAL)
-                    )
-            elif last.y == current.y:
-                for i in range(self.min_straight, self.max_straight + 1):
-                    all_neighbors.add(
-                        Coord(current.x, current.y + i, Direction.VERTICAL)
-                    )
-                    all_neighbors.add(
-                        Coord(current.x, current.y - i, Direction.VERTICAL)
-                    )
-            else:
-                raise ValueError()
-        else:
-            for i in range(self.min_straight, self.max_straight + 1):
-                all_neighbors.add(Coord(current.x + i, current.y, Direction.HORIZONTAL))
-                all_neighbors.add(Coord(current.x - i, current.y, Direction.HORIZONTAL))
-                all_neighbors.add(Coord(current.x, current.y + i, Direction.VERTICAL))
-                all_neighbors.add(Coord(current.x, current.y - i, Direction.VERTICAL))
-
-        for neighbor in all_neighbors:
-            if neighbor.x < 0 or neighbor.x >= len(self.lava_map[0]):
-                continue
-            if neighbor.y < 0 or neighbor.y >= len(self.lava_map):
-                continue
-            yield neighbor
-
-
-def part_1(puzzle: PuzzleInput) -> Any:
-    lava_map: list[list[int]] = []
-    for line in puzzle.lines:
-        lava_map.append([int(x) for x in line])
-
-    start = Coord(0, 0, Direction.HORIZONTAL)
-    goals = [
-        Coord(len(lava_map[0]) - 1, len(lava_map) - 1, Direction.HORIZONTAL),
-        Coord(len(lava_map[0]) - 1, len(lava_map) - 1, Direction.VERTICAL),
-    ]
-    costs = []
-    for goal in goals:
-        _, cost = a_star(
-            start,
-            goal,
-            heuristic,
-            CostFunction(lava_map),
-            NeighborFunction(lava_map, 1, 3),
-        )
-        costs.append(cost)
-    return min(costs)
-
-
-def part_2(puzzle: PuzzleInput) -> Any:
-    lava_map: list[list[int]] = []
-    for line in puzzle.lines:
-        lava_map.append([int(x) for x in line])
-
-    start = Coord(0, 0, Direction.HORIZONTAL)
-    goals = [
-        Coord(len(lava_map[0]) - 1, len(lava_map) - 1, Direction.HORIZONTAL),
-        Coord(len(lava_map[0]) - 1, len(lava_map) - 1, Direction.VERTICAL),
-    ]
-    costs = []
-    for goal in goals:
-        _, cost = a_star(
-            start,
-            goal,
-            heuristic,
-            CostFunction(lava_map),
-            NeighborFunction(lava_map, 4, 10),
-        )
-        costs.append(cost)
-    return min(costs)
+        turn_horizontal = last is None or current & VERTICAL
+        turn_vertical = last is None or not current & VERTICAL
+        for i in range(self.min_straight, self.max_straight + 1):
+            if turn_horizontal:
+                if x + i < self.lava_map.width:
+                    yield (index + i) * 2 + HORIZONTAL
+                if x - i >= 0:
+                    yield (index - i) * 2 + HORIZONTAL
+            if turn_vertical:
+                if y + i < self.lava_map.height:
+                    yield (index + i * row_step) * 2 + VERTICAL
+                if y - i >= 0:
+                    yield (index - i * row_step) * 2 + VERTICAL
+
+
+def prepare(puzzle: PuzzleInput) -> Grid:
+    lava_map = Grid.from_lines(puzzle.lines)
+    lava_map.cells = lava_map.cells.translate(DIGITS)
+    return lava_map
+
+
+def least_heat_loss(lava_map: Grid, min_straight: int, max_straight: int) -> float:
+    start = lava_map.index(0, 0) * 2 + HORIZONTAL
+    end = lava_map.index(lava_map.width - 1, lava_map.height - 1)
+    # Arriving either way round will do
+    result = search(
+        [start],
+        {end * 2 + HORIZONTAL, end * 2 + VERTICAL},
+        CostFunction(lava_map),
+        NeighborFunction(lava_map, min_straight, max_straight),
+        estimate=Heuristic(lava_map, end),
+        int_costs=True,
+    )
+    return result.cost
+
+
+def part_1(lava_map: Grid) -> Any:
+    return least_heat_loss(lava_map, 1, 3)
+
+
+def part_2(lava_map: Grid) -> Any:
+    return least_heat_loss(lava_map, 4, 10)
@@ -2,7 +2,7 @@ import itertools
 from enum import IntEnum, auto
 from typing import Any, NamedTuple
 
-from aoc.utils.common import Coord, Direction
+from aoc.utils.common import Coord, Direction, Packer
 from aoc.utils.contents import PuzzleInput
 
 
@@ -72,19 +72,13 @@ def next_point(current: Coord, instruction: Instruction) -> Coord:
 
 
 def get_inside_perimiter(
-    start: Coord, perimiter: set[Coord], limit=1000
-) -> set[Coord] | None:
+    start: int, perimiter: set[int], packer: Packer, limit=1000
+) -> set[int] | None:
     frontier = [start]
     seen = {start}
     while len(frontier) > 0:
         current = frontier.pop()
-        neighbors = {
-            Coord(current.x, current.y + 1),
-            Coord(current.x, current.y - 1),
-            Coord(current.x - 1, current.y),
-            Coord(current.x + 1, current.y),
-        }
-        unseen = neighbors - seen
+        unseen = set(packer.neighbors(current)) - seen
         unseen -= perimiter
         frontier.extend(unseen)
         seen.update(unseen)
@@ -94,18 +88,28 @@ def get_inside_perimiter(
 
 
 def interior(instructions: list[Instruction]) -> int:
+    corners = coordinates_from_instructions(instructions)
+    min_x = min(corner.x for corner in corners) - 1
+    min_y = min(corner.y for corner in corners) - 1
+    # A column spare either side, so stepping off a row only ever goes from
+    # outside the loop to outside it
+    packer = Packer(max(corner.x for corner in corners) - min_x + 2)
+
+    def pack(coord: Coord) -> int:
+        return packer.pack(Coord(coord.x - min_x, coord.y - min_y))
+
     last = Coord(0, 0)
-    loop = {last}
+    loop = {pack(last)}
 
     for instruction in instructions:
         next_coord = next_point(last, instruction)
-        loop.update(points_in_between(last, next_coord))
+        loop.update(map(pack, points_in_between(last, next_coord)))
         last = next_coord
 
     possibly_inside = [Coord(-1, -1), Coord(1, 1), Coord(-1, 1), Coord(1, -1)]
     interior = None
     for coord in possibly_inside:
-        maybe_interior = get_inside_perimiter(coord, loop, limit=100000)
+        maybe_interior = get_inside_perimiter(pack(coord), loop, packer, limit=100000)
         if maybe_interior:
             interior = maybe_interior
 
@@ -1,8 +1,10 @@
+import functools
 import re
 from enum import Enum
 from typing import Any, Literal, NamedTuple
 
 from aoc.utils.contents import PuzzleInput
+from aoc.utils.parallel import map_reduce
 
 
 class Part(NamedTuple):
@@ -86,19 +88,18 @@ def next_condition(part: Part, condition: Condition) -> str:
     return condition.final
 
 
-def accepted_value(parts: list[Part], conditions: dict[str, Condition]) -> int:
-    total = 0
-    for part in parts:
-        current = "in"
-        while True:
-            current = next_condition(part, conditions[current])
-            if current == "R":
-                break
-            if current == "A":
-                total += part.x + part.m + part.s + part.a
-                break
+def part_value(conditions: dict[str, Condition], part: Part) -> int:
+    current = "in"
+    while True:
+        current = next_condition(part, conditions[current])
+        if current == "R":
+            return 0
+        if current == "A":
+            return part.x + part.m + part.s + part.a
 
-    return total
+
+def accepted_value(parts: list[Part], conditions: dict[str, Condition]) -> int:
+    return map_reduce(functools.partial(part_value, conditions), parts)
 
 
 def part_1(puzzle: PuzzleInput) -> Any:
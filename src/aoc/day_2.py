@@ -1,9 +1,17 @@
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Any, NamedTuple
 
-import parse
+from aoc.utils.contents import PuzzleInput, PuzzleStream
+from aoc.utils.parallel import map_reduce
+from aoc.utils.parsing import Format
 
-from aoc.utils.contents import PuzzleInput
+STREAMING = True
+RED = Format("{:d} red")
+GREEN = Format("{:d} green")
+BLUE = Format("{:d} blue")
 
 
 class Pull(NamedTuple):
@@ -23,42 +31,47 @@ def parse_game(line: str) -> Game:
     game_id = int(game_raw.split(" ", maxsplit=1)[1])
     pulls = []
     for pull_raw in pulls_raw.split("; "):
-        red_result = parse.search("{:d} red", pull_raw)
+        red_result = RED.search(pull_raw)
         if red_result is None:
             red = 0
         else:
-            red = red_result.fixed[0]
+            red = red_result[0]
 
-        blue_result = parse.search("{:d} blue", pull_raw)
+        blue_result = BLUE.search(pull_raw)
         if blue_result is None:
             blue = 0
         else:
-            blue = blue_result.fixed[0]
+            blue = blue_result[0]
 
-        green_result = parse.search("{:d} green", pull_raw)
+        green_result = GREEN.search(pull_raw)
         if green_result is None:
             green = 0
         else:
-            green = green_result.fixed[0]
+            green = green_result[0]
 
         pulls.append(Pull(red, green, blue))
     return Game(id=game_id, pulls=pulls)
 
 
+BAG = Pull(12, 13, 14)
+
+
 def possible_game(game: Game) -> int:
     for pull in game.pulls:
-        if pull.red > 12 or pull.green > 13 or pull.blue > 14:
+        if pull.red > BAG.red or pull.green > BAG.green or pull.blue > BAG.blue:
             return 0
     return game.id
 
 
-def part_1(puzzle: PuzzleInput) -> Any:
-    games = list(map(parse_game, puzzle.lines))
-    possible = sum(map(possible_game, games))
-    return possible
+def possible_line(line: str) -> int:
+    return possible_game(parse_game(line))
 
 
-def min_balls(game: Game) -> int:
+def part_1(puzzle: PuzzleInput | PuzzleStream) -> Any:
+    return map_reduce(possible_line, puzzle.lines)
+
+
+def max_pull(game: Game) -> Pull:
     red, green, blue = 0, 0, 0
     for pull in game.pulls:
         if pull.red > red:
@@ -67,12 +80,64 @@ def min_balls(game: Game) -> int:
             green = pull.green
         if pull.blue > blue:
             blue = pull.blue
+    return Pull(red, green, blue)
+
+
+def min_balls(game: Game) -> int:
+    red, green, blue = max_pull(game)
     return red * green * blue
 
 
-def part_2(puzzle: PuzzleInput) -> Any:
-    games = list(map(parse_game, puzzle.lines))
-    power_set = list(map(min_balls, games))
-    total = sum(power_set)
-    return total
-    return 0
+def line_power(line: str) -> int:
+    return min_balls(parse_game(line))
+
+
+def part_2(puzzle: PuzzleInput | PuzzleStream) -> Any:
+    return map_reduce(line_power, puzzle.lines)
+
+
+class GameIndex:
+    # Every game boiled down to the most of each colour it ever showed, for
+    # checking the same games against lots of different bags. The maxima are
+    # kept column by column, and for each colour the games are also kept in
+    # order of it, so a bag only has to look at the games that fit under
+    # whichever of its limits lets the fewest through.
+    def __init__(self, games: Iterable[Game]) -> None:
+        self.ids = array("q")
+        self.maxima = (array("q"), array("q"), array("q"))
+        for game in games:
+            self.ids.append(game.id)
+            for column, most in zip(self.maxima, max_pull(game)):
+                column.append(most)
+
+        self.orders = []
+        self.sorted_maxima = []
+        for column in self.maxima:
+            order = sorted(range(len(column)), key=column.__getitem__)
+            self.orders.append(array("q", order))
+            self.sorted_maxima.append(array("q", (column[i] for i in order)))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def possible_sum(self, bag: Pull) -> int:
+        # The sum of the IDs of the games that could have come out of the bag
+        fits = [
+            bisect_right(values, limit)
+            for values, limit in zip(self.sorted_maxima, bag)
+        ]
+        colour = min(range(len(fits)), key=fits.__getitem__)
+        reds, greens, blues = self.maxima
+        total = 0
+        for game in self.orders[colour][: fits[colour]]:
+            if reds[game] <= bag.red and greens[game] <= bag.green:
+                if blues[game] <= bag.blue:
+                    total += self.ids[game]
+        return total
+
+    def possible_sums(self, bags: Iterable[Pull]) -> list[int]:
+        return [self.possible_sum(bag) for bag in bags]
+
+
+def index_games(lines: Iterable[str]) -> GameIndex:
+    return GameIndex(parse_game(line) for line in lines if line.strip() != "")
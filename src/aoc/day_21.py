@@ -1,27 +1,17 @@
-import functools
-from typing import Any
+from typing import Any, NamedTuple
 
-from aoc.utils.common import Coord
+from aoc.utils.common import Coord, Direction, Packer
 from aoc.utils.contents import PuzzleInput
+from aoc.utils.grid import Grid
 
+ROCK = ord("#")
 
-def parse_input(lines: list[str]) -> Coord:
-    start = None
-    y = 0
-    for line in lines:
-        if "S" in line:
-            x = line.find("S")
-            start = Coord(x, y)
-            break
-        y += 1
 
-    if not start:
-        raise ValueError()
+def parse_input(garden: Grid) -> Coord:
+    return garden.coord(garden.find("S"))
 
-    return start
 
-
-def get_reachable(steps: int, start: Coord, garden: list[str]) -> int:
+def get_reachable(steps: int, start: Coord, garden: Grid) -> int:
     fields_at_step = set()
     frontier: set[tuple[int, Coord]] = {(0, start)}
     while len(frontier) > 0:
@@ -44,11 +34,11 @@ def get_reachable(steps: int, start: Coord, garden: list[str]) -> int:
         neighbors: set[Coord] = set()
 
         for neighbor in potential_neighbors:
-            if neighbor.x < 0 or neighbor.x >= len(garden[0]):
+            if neighbor.x < 0 or neighbor.x >= garden.width:
                 continue
-            if neighbor.y < 0 or neighbor.y >= len(garden):
+            if neighbor.y < 0 or neighbor.y >= garden.height:
                 continue
-            if garden[neighbor.y][neighbor.x] == "#":
+            if garden[garden.index(neighbor.x, neighbor.y)] == ROCK:
                 continue
             neighbors.add(neighbor)
 
@@ -58,34 +48,64 @@ def get_reachable(steps: int, start: Coord, garden: list[str]) -> int:
     return len(fields_at_step)
 
 
-@functools.lru_cache(maxsize=None)
-def get_neighbors(coord: Coord, garden: tuple[str, ...]) -> list[Coord]:
-    potential_neighbors: list[Coord] = [
-        Coord(coord.x + 1, coord.y),
-        Coord(coord.x - 1, coord.y),
-        Coord(coord.x, coord.y + 1),
-        Coord(coord.x, coord.y - 1),
-    ]
+class Tiling(NamedTuple):
+    garden: Grid
+    packer: Packer
+    # The packed steps out of every cell of the garden that miss the rocks
+    moves: list[tuple[int, ...]]
+
+
+def tile(garden: Grid, steps: int) -> Tiling:
+    # Enough copies of the garden either side of the start that nothing in
+    # reach goes negative, with a width that keeps x % width the garden column
+    tiles = 2 * (steps // min(garden.width, garden.height) + 1) + 1
+    packer = Packer(garden.width * tiles)
+    steps_to = [(d.value, packer.offset(d)) for d in Direction]
+    rows = [row.tobytes() for row in garden.rows()]
+    moves = []
+    for y in range(garden.height):
+        for x in range(garden.width):
+            moves.append(
+                tuple(
+                    offset
+                    for step, offset in steps_to
+                    if rows[(y + step.y) % garden.height][(x + step.x) % garden.width]
+                    != ROCK
+                )
+            )
+    return Tiling(garden, packer, moves)
+
+
+def get_start(tiling: Tiling) -> int:
+    garden, packer, _ = tiling
+    start = parse_input(garden)
+    middle = packer.width // garden.width // 2
+    return packer.pack(
+        Coord(start.x + middle * garden.width, start.y + middle * garden.height)
+    )
 
-    neighbors = []
-    for neighbor in potential_neighbors:
-        if garden[neighbor.y % len(garden)][neighbor.x % len(garden[0])] != "#":
-            neighbors.append(neighbor)
 
-    return neighbors
+def get_moves(tiling: Tiling, packed: int) -> tuple[int, ...]:
+    garden, packer, moves = tiling
+    y = packed // packer.width % garden.height
+    return moves[y * garden.width + packed % garden.width]
 
 
-def part_1(puzzle: PuzzleInput) -> Any:
-    start = parse_input(puzzle.lines)
+def prepare(puzzle: PuzzleInput) -> Grid:
+    return Grid.from_lines(puzzle.lines)
+
+
+def part_1(garden: Grid) -> Any:
+    tiling = tile(garden, 64)
+    start = get_start(tiling)
     frontier = {start}
     frontier_size = len(frontier)
     seen = {start}
-    garden = tuple(puzzle.lines)
     growth = []
     fields_at_step = [len(seen)]
 
     for _ in range(64):
-        frontier = get_next_frontier(frontier, seen, garden)
+        frontier = get_next_frontier(frontier, seen, tiling)
         seen.update(frontier)
         growth.append(len(frontier) - frontier_size)
         frontier_size = len(frontier)
@@ -97,62 +117,43 @@ def part_1(puzzle: PuzzleInput) -> Any:
     return total
 
 
-def get_reachable_coords(
-    start: Coord, steps: int, garden: tuple[str, ...]
-) -> dict[Coord, int]:
-    frontier: set[Coord] = {start}
-    distances: dict[Coord, int] = {start: 0}
+def get_reachable_coords(start: int, steps: int, tiling: Tiling) -> dict[int, int]:
+    frontier: set[int] = {start}
+    distances: dict[int, int] = {start: 0}
     for dist in range(1, steps + 1):
         next_frontier = set()
         while len(frontier) > 0:
-            coord = frontier.pop()
-            x_offset = (coord.x // len(garden[0])) * len(garden[0])
-            y_offset = (coord.y // len(garden)) * len(garden)
-            central_neighbors = get_neighbors(
-                Coord(coord.x % len(garden[0]), coord.y % len(garden)), garden
-            )
-            for central_neighbor in central_neighbors:
-                neighbor = Coord(
-                    central_neighbor.x + x_offset, central_neighbor.y + y_offset
-                )
+            packed = frontier.pop()
+            for move in get_moves(tiling, packed):
+                neighbor = packed + move
                 if neighbor not in distances:
                     next_frontier.add(neighbor)
                     distances[neighbor] = dist
-        frontier = next_frontier.copy()
+        frontier = next_frontier
 
     return distances
 
 
-def get_fields_up_to(distance: dict[Coord, int], at: int) -> int:
+def get_fields_up_to(distance: dict[int, int], at: int) -> int:
     return len([x for x in distance.values() if x <= at and x % 2 == at % 2])
 
 
-def get_next_frontier(
-    current: set[Coord], seen: set[Coord], garden: tuple[str, ...]
-) -> set[Coord]:
-    frontier: set[Coord] = set()
-    for coord in current:
-        x_offset = (coord.x // len(garden[0])) * len(garden[0])
-        y_offset = (coord.y // len(garden)) * len(garden)
-        central_neighbors = get_neighbors(
-            Coord(coord.x % len(garden[0]), coord.y % len(garden)), garden
-        )
-        for central_neighbor in central_neighbors:
-            neighbor = Coord(
-                central_neighbor.x + x_offset, central_neighbor.y + y_offset
-            )
+def get_next_frontier(current: set[int], seen: set[int], tiling: Tiling) -> set[int]:
+    frontier: set[int] = set()
+    for packed in current:
+        for move in get_moves(tiling, packed):
+            neighbor = packed + move
             if neighbor not in seen:
                 frontier.add(neighbor)
 
     return frontier
 
 
-def part_2(puzzle: PuzzleInput) -> Any:
+def part_2(garden: Grid) -> Any:
     steps = 26501365
-    start = parse_input(puzzle.lines)
-    garden = tuple(puzzle.lines)
+    tiling = tile(garden, 65 + (2 * 131))
 
-    reachable = get_reachable_coords(start, 65 + (2 * 131), garden)
+    reachable = get_reachable_coords(get_start(tiling), 65 + (2 * 131), tiling)
     x_1 = get_fields_up_to(reachable, 65)
     x_2 = get_fields_up_to(reachable, 65 + 131)
     x_3 = get_fields_up_to(reachable, 65 + (2 * 131))
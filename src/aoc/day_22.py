@@ -1,9 +1,8 @@
 import itertools
-from collections import defaultdict
 from dataclasses import dataclass
 from typing import Any, Mapping, NamedTuple
 
-from aoc.utils.common import Coord
+from aoc.utils.common import Coord, Packer
 from aoc.utils.contents import PuzzleInput
 
 
@@ -20,13 +19,13 @@ class BrickSnapshot(NamedTuple):
     def height(self) -> int:
         return abs(self.end.z - self.start.z) + 1
 
-    def get_shadow(self) -> list[Coord]:
+    def get_shadow(self, packer: Packer) -> list[int]:
         points = []
         x_dir = 1 if self.start.x < self.end.x else -1
         for x in range(self.start.x, self.end.x + x_dir, x_dir):
             y_dir = 1 if self.start.y < self.end.y else -1
             for y in range(self.start.y, self.end.y + y_dir, y_dir):
-                points.append(Coord(x, y))
+                points.append(packer.pack(Coord(x, y)))
 
         return points
 
@@ -71,6 +70,11 @@ class Dependency:
     supported_by: set[Brick]
 
 
+class Tower(NamedTuple):
+    bricks: list[Brick]
+    dependencies: dict[Brick, Dependency]
+
+
 def parse_line(line: str) -> BrickSnapshot:
     left, right = line.split("~")
     x, y, z = left.split(",")
@@ -86,19 +90,22 @@ def parse_puzzle(lines: list[str]) -> list[BrickSnapshot]:
     return bricks
 
 
-def get_min_height(heightmap: dict[Coord, int], brick: BrickSnapshot) -> int:
-    heights = [heightmap[c] for c in brick.get_shadow()]
+def get_min_height(heightmap: list[int], shadow: list[int]) -> int:
+    heights = [heightmap[c] for c in shadow]
     return max(heights)
 
 
 def drop_bricks(bricks: list[BrickSnapshot]) -> list[Brick]:
-    heightmap: dict[Coord, int] = defaultdict(lambda: 1)
+    ends = [end for brick in bricks for end in brick]
+    packer = Packer(max(end.x for end in ends) + 1)
+    heightmap = [1] * packer.width * (max(end.y for end in ends) + 1)
 
     fallen = []
     for brick in bricks:
-        min_height = get_min_height(heightmap, brick)
+        shadow = brick.get_shadow(packer)
+        min_height = get_min_height(heightmap, shadow)
 
-        for point in brick.get_shadow():
+        for point in shadow:
             heightmap[point] = min_height + brick.height()
 
         fallen.append(brick.to_brick(min_height))
@@ -140,10 +147,14 @@ def to_graphviz(graph: dict[Brick, Dependency]) -> None:
         number += 1
 
 
-def part_1(puzzle: PuzzleInput) -> Any:
+def prepare(puzzle: PuzzleInput) -> Tower:
     bricks_snapshot = parse_puzzle(puzzle.lines)
     bricks = drop_bricks(bricks_snapshot)
-    dependencies = get_support_graph(bricks)
+    return Tower(bricks, get_support_graph(bricks))
+
+
+def part_1(tower: Tower) -> Any:
+    bricks, dependencies = tower
     can_be_deleted = set()
     for brick in bricks:
         dependency = dependencies[brick]
@@ -168,7 +179,7 @@ def bricks_would_fall(brick: Brick, graph: Mapping[Brick, Dependency]) -> int:
         return 0
 
     toppled = {brick}
-    frontier = graph[brick].supports
+    frontier = set(graph[brick].supports)
     while len(frontier) > 0:
         current = frontier.pop()
         if len(graph[current].supported_by - toppled) == 0:
@@ -178,11 +189,8 @@ def bricks_would_fall(brick: Brick, graph: Mapping[Brick, Dependency]) -> int:
     return len(toppled) - 1
 
 
-def part_2(puzzle: PuzzleInput) -> Any:
-    bricks_snapshot = parse_puzzle(puzzle.lines)
-    bricks = drop_bricks(bricks_snapshot)
-    dependencies = get_support_graph(bricks)
-
+def part_2(tower: Tower) -> Any:
+    bricks, dependencies = tower
     cant_be_deleted = []
     for brick in bricks:
         dependency = dependencies[brick]
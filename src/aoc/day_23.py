@@ -3,43 +3,49 @@ import itertools
 from collections import defaultdict
 from typing import Any
 
-from aoc.utils.common import Coord
 from aoc.utils.contents import PuzzleInput
+from aoc.utils.grid import Grid
+
+PATH = ord(".")
+SLOPES = bytes.maketrans(b"><v", b"...")
 
 
 class CostFunc:
-    def __call__(self, current: Coord, last: Coord) -> int:
-        x_diff = abs(current.x - last.x)
-        y_diff = abs(current.y - last.y)
-        return x_diff + y_diff
+    def __init__(self, trails: Grid) -> None:
+        self.trails = trails
+
+    def __call__(self, current: int, last: int) -> int:
+        y, x = divmod(current, self.trails.row_step)
+        last_y, last_x = divmod(last, self.trails.row_step)
+        return abs(x - last_x) + abs(y - last_y)
 
 
 class NeighborFunc:
-    def __init__(self, trails: tuple[str, ...], slippery: bool = True) -> None:
+    def __init__(self, trails: Grid, slippery: bool = True) -> None:
         self.trails = trails
         self.slippery = slippery
+        north, east, south, west = trails.orthogonal
+        # Each way to step, and the slope that can be walked down going that way
+        self.steps = (
+            (south, ord("v")),
+            (east, ord(">")),
+            (north, -1),
+            (west, ord("<")),
+        )
 
     @functools.lru_cache(maxsize=None)
-    def __call__(self, current: Coord, paths: tuple[Coord, ...]) -> list[Coord]:
+    def __call__(self, current: int, paths: tuple[int, ...]) -> list[int]:
         neighbors = []
-        for x, y in ((0, 1), (1, 0), (0, -1), (-1, 0)):
-            new_loc = Coord(current.x + x, current.y + y)
+        for step, slope in self.steps:
+            new_loc = current + step
             if new_loc in paths:
                 continue
-            if new_loc.y < 0 or new_loc.y > len(self.trails) - 1:
-                continue
-            if self.trails[new_loc.y][new_loc.x] == ".":
+            # The border is forest, so this never steps off the map
+            if self.trails[new_loc] == PATH:
                 neighbors.append(new_loc)
-            elif (
-                self.trails[new_loc.y][new_loc.x] == ">"
-                and x == 1
-                or self.trails[new_loc.y][new_loc.x] == "<"
-                and x == -1
-                or self.trails[new_loc.y][new_loc.x] == "v"
-                and y == 1
-            ):
+            elif self.trails[new_loc] == slope:
                 if self.slippery:
-                    neighbors.append(Coord(new_loc.x + x, new_loc.y + y))
+                    neighbors.append(new_loc + step)
                 else:
                     neighbors.append(new_loc)
             else:
@@ -47,8 +53,8 @@ class NeighborFunc:
         return neighbors
 
 
-def _path_cost(trails: tuple[str, ...], paths: list[Coord]) -> int:
-    cost = CostFunc()
+def _path_cost(trails: Grid, paths: list[int]) -> int:
+    cost = CostFunc(trails)
     total = 0
     for first, second in itertools.pairwise(paths):
         total += cost(first, second)
@@ -58,15 +64,16 @@ def _path_cost(trails: tuple[str, ...], paths: list[Coord]) -> int:
 
 @functools.lru_cache(maxsize=None)
 def get_neighbors(
-    junction: Coord,
-    current: Coord,
-    trails: tuple[str, ...],
+    junction: int,
+    current: int,
+    trails: Grid,
     neighbor_func: NeighborFunc,
-) -> tuple[Coord, int]:
+) -> tuple[int, int]:
+    first, last = trails.index(0, 0), trails.index(0, trails.height - 1)
     path = [junction, current]
     while True:
-        if current.y == 0:
-            return Coord(1, 0), _path_cost(trails, path)
+        if current < first + trails.row_step:
+            return trails.index(1, 0), _path_cost(trails, path)
         next_locs = neighbor_func(current, tuple(path))
         if len(next_locs) == 0:
             raise ValueError()
@@ -74,7 +81,7 @@ def get_neighbors(
             path.append(next_locs[0])
             current = next_locs[0]
 
-            if current.y == len(trails) - 1:
+            if current >= last:
                 return next_locs[0], _path_cost(trails, path)
 
             continue
@@ -82,22 +89,27 @@ def get_neighbors(
             return current, _path_cost(trails, path)
 
 
-def get_start_end(lines: list[str]) -> tuple[Coord, Coord]:
-    start = Coord(lines[0].index("."), 0)
-    end = Coord(lines[-1].index("."), len(lines) - 1)
+def get_start_end(trails: Grid) -> tuple[int, int]:
+    start = trails.index(trails.row(0).tolist().index(PATH), 0)
+    last = trails.height - 1
+    end = trails.index(trails.row(last).tolist().index(PATH), last)
     return start, end
 
 
-def part_1(puzzle: PuzzleInput) -> Any:
-    start, end = get_start_end(puzzle.lines)
-    graph, connections = get_junctions(start, end, tuple(puzzle.lines))
+def prepare(puzzle: PuzzleInput) -> Grid:
+    return Grid.from_lines(puzzle.lines, padding=1, sentinel="#")
+
+
+def part_1(trails: Grid) -> Any:
+    start, end = get_start_end(trails)
+    graph, connections = get_junctions(start, end, trails)
     cost = dfs(graph, connections, 0, 0, start, end, set())
     return cost
 
 
 def get_junctions(
-    start: Coord, end: Coord, trails: tuple[str, ...]
-) -> tuple[dict[tuple[Coord, Coord], int], dict[Coord, set[Coord]]]:
+    start: int, end: int, trails: Grid
+) -> tuple[dict[tuple[int, int], int], dict[int, set[int]]]:
     neighbor = NeighborFunc(trails, True)
     frontier = {start}
     seen = set()
@@ -121,13 +133,13 @@ def get_junctions(
 
 
 def dfs(
-    graph: dict[tuple[Coord, Coord], int],
-    connections: dict[Coord, set[Coord]],
+    graph: dict[tuple[int, int], int],
+    connections: dict[int, set[int]],
     dist: int,
     best: int,
-    start: Coord,
-    end: Coord,
-    seen: set[Coord],
+    start: int,
+    end: int,
+    seen: set[int],
 ) -> int:
     if start == end:
         return dist
@@ -152,13 +164,11 @@ def dfs(
     return max(highest)
 
 
-def part_2(puzzle: PuzzleInput) -> Any:
-    start, end = get_start_end(puzzle.lines)
-    test = puzzle.lines
-    test_2 = []
-    for line in test:
-        test_2.append(line.replace(">", ".").replace("v", ".").replace("<", "."))
+def part_2(trails: Grid) -> Any:
+    start, end = get_start_end(trails)
+    # The slopes are just path once the boots stop slipping
+    dry = Grid(trails.cells.translate(SLOPES), trails.width, trails.height, 1)
 
-    graph, connections = get_junctions(start, end, tuple(test_2))
+    graph, connections = get_junctions(start, end, dry)
     cost = dfs(graph, connections, 0, 0, start, end, set())
     return cost
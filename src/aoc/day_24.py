@@ -1,3 +1,4 @@
+from array import array
 from collections.abc import Iterator
 import functools
 import multiprocessing as mp
@@ -8,6 +9,7 @@ import math
 
 from tqdm import tqdm
 from aoc.utils.contents import PuzzleInput
+from aoc.utils.parsing import int_array
 
 
 class Vector3D(NamedTuple):
@@ -48,17 +50,15 @@ class Hail:
         theirs = other.position.x**2 + other.position.y**2 + other.position.z**2
         return ours < theirs
 
-def parse_line(line: str) -> Hail:
-    left, right = line.split(" @ ", maxsplit=1)
-    px, py, pz = left.split(", ")
-    vx, vy, vz = right.split(", ")
-    position = Vector3D(float(px), float(py), float(pz))
-    vector = Vector3D(float(vx), float(vy), float(vz))
-    return Hail(position, vector)
-
-
-def parse_input(lines: list[str]) -> list[Hail]:
-    return list(map(parse_line, lines))
+def parse_input(numbers: "array[int]") -> list[Hail]:
+    # Six numbers a hailstone, the position and then the velocity
+    hail = []
+    values = iter(numbers)
+    for px, py, pz, vx, vy, vz in zip(*[values] * 6):
+        position = Vector3D(float(px), float(py), float(pz))
+        vector = Vector3D(float(vx), float(vy), float(vz))
+        hail.append(Hail(position, vector))
+    return hail
 
 
 def xy_line_intersect(first: Hail, second: Hail) -> Vector3D | None:
@@ -85,8 +85,11 @@ def xy_intercept_in_past(hail: Hail, intersect: Vector3D) -> bool:
     return False
 
 
-def part_1(puzzle: PuzzleInput) -> Any:
-    hail = parse_input(puzzle.lines)
+def prepare(puzzle: PuzzleInput) -> list[Hail]:
+    return parse_input(int_array(puzzle.view))
+
+
+def part_1(hail: list[Hail]) -> Any:
     min_area = 200000000000000
     max_area = 400000000000000
     total = 0
@@ -256,6 +259,5 @@ def _mul_inv(a: int, b: int) -> int:
     return x1
 
 
-def part_2(puzzle: PuzzleInput) -> Any:
-    hail = parse_input(puzzle.lines)
+def part_2(hail: list[Hail]) -> Any:
     return get_intersection(hail, limit=1000)
@@ -1,101 +1,179 @@
 import re
-from collections import defaultdict
-from typing import Any
+from collections import defaultdict, deque
+from collections.abc import Iterable, Iterator
+from itertools import accumulate
+from typing import Any, NamedTuple
 
 from aoc.utils.common import Coord
-from aoc.utils.contents import PuzzleInput
+from aoc.utils.contents import PuzzleInput, PuzzleStream
+from aoc.utils.grid import Grid
 
+NUMBER = re.compile(rb"\d+")
+SYMBOL = re.compile(rb"[^.\d]")
+STAR = ord("*")
+STAR_BYTES = b"*"
 
-def number_adjacent_to_symbol(left: Coord, right: Coord, puzzle: list[str]) -> bool:
-    if (
-        puzzle[left.y][left.x - 1] != "."
-        or puzzle[left.y - 1][left.x - 1] != "."
-        or puzzle[left.y + 1][left.x - 1] != "."
-        or puzzle[left.y][right.x + 1] != "."
-        or puzzle[left.y - 1][right.x + 1] != "."
-        or puzzle[left.y + 1][right.x + 1] != "."
-    ):
-        return True
 
-    for x in range(left.x, right.x + 1):
-        if puzzle[left.y - 1][x] != "." or puzzle[left.y + 1][x] != ".":
-            return True
+class Schematic(NamedTuple):
+    # (first cell, last cell, value) for every number
+    numbers: list[tuple[int, int, int]]
+    # How many of the cells before each one are next to a symbol
+    touching: list[int]
+    # The stars next to each cell that has any
+    gears: dict[int, list[int]]
 
-    return False
 
-
-def get_number_indexes(lines: list[str]) -> list[tuple[Coord, Coord, int]]:
+def get_number_indexes(grid: Grid) -> list[tuple[int, int, int]]:
     number_positions = []
-    y = 0
-    for line in lines:
-        for num_match in re.finditer(r"\d+", line):
+    for y, row in enumerate(grid.rows()):
+        for num_match in NUMBER.finditer(row):
             pos = num_match.span()
-            first = Coord(pos[0], y)
-            second = Coord(pos[1] - 1, y)
+            first = grid.index(pos[0], y)
+            second = grid.index(pos[1] - 1, y)
             number_positions.append((first, second, int(num_match.group())))
-        y += 1
 
     return number_positions
 
 
-def pad(puzzle: PuzzleInput) -> list[str]:
-    lines = puzzle.lines
-    i = 0
-    for i in range(len(lines)):
-        lines[i] = "." + lines[i] + "."
-    lines.insert(0, "." * len(lines[0]))
-    lines.append("." * len(lines[1]))
-    return lines
+def pad(puzzle: PuzzleInput) -> Grid:
+    # A border of dots, so the neighbours of every number exist
+    return Grid.from_lines(puzzle.lines, padding=1, sentinel=".")
+
+
+def survey(grid: Grid) -> Schematic:
+    # One pass over the symbols, marking every cell next to one, and which
+    # stars every cell is next to. Running totals of the marks then say
+    # whether any cell of a number touches a symbol with one subtraction.
+    mask = bytearray(len(grid.cells))
+    gears = defaultdict(list)
+    for y, row in enumerate(grid.rows()):
+        for symbol in SYMBOL.finditer(row):
+            i = grid.index(symbol.start(), y)
+            is_star = grid[i] == STAR
+            for offset in grid.adjacent:
+                mask[i + offset] = 1
+                if is_star:
+                    gears[i + offset].append(i)
+    touching = list(accumulate(mask, initial=0))
+    return Schematic(get_number_indexes(grid), touching, gears)
+
+
+def prepare(puzzle: PuzzleInput) -> Schematic:
+    return survey(pad(puzzle))
 
 
-def part_1(puzzle: PuzzleInput) -> Any:
-    # Pad the puzzle with a border
-    lines = pad(puzzle)
+def number_adjacent_to_symbol(left: int, right: int, schematic: Schematic) -> bool:
+    return schematic.touching[right + 1] > schematic.touching[left]
 
-    numbers = get_number_indexes(lines)
+
+def part_1(schematic: Schematic) -> Any:
     total = 0
-    for left, right, value in numbers:
-        if number_adjacent_to_symbol(left, right, lines):
+    for left, right, value in schematic.numbers:
+        if number_adjacent_to_symbol(left, right, schematic):
             total += value
 
     return total
 
 
-def number_adjacent_to_star(
-    left: Coord, right: Coord, puzzle: list[str]
-) -> Coord | None:
-    if puzzle[left.y][left.x - 1] == "*":
-        return Coord(left.x - 1, left.y)
-    if puzzle[left.y - 1][left.x - 1] == "*":
-        return Coord(left.x - 1, left.y - 1)
-    if puzzle[left.y + 1][left.x - 1] == "*":
-        return Coord(left.x - 1, left.y + 1)
-    if puzzle[left.y][right.x + 1] == "*":
-        return Coord(right.x + 1, left.y)
-    if puzzle[left.y - 1][right.x + 1] == "*":
-        return Coord(right.x + 1, left.y - 1)
-    if puzzle[left.y + 1][right.x + 1] == "*":
-        return Coord(right.x + 1, left.y + 1)
-
-    for x in range(left.x, right.x + 1):
-        if puzzle[left.y - 1][x] != ".":
-            return Coord(x, left.y - 1)
-        if puzzle[left.y + 1][x] != ".":
-            return Coord(x, left.y + 1)
-
-
-def part_2(puzzle: PuzzleInput) -> Any:
-    lines = pad(puzzle)
+def number_adjacent_to_stars(left: int, right: int, schematic: Schematic) -> set[int]:
+    stars: set[int] = set()
+    if number_adjacent_to_symbol(left, right, schematic):
+        for i in range(left, right + 1):
+            stars.update(schematic.gears.get(i, ()))
+    return stars
+
+
+def part_2(schematic: Schematic) -> Any:
     gears = defaultdict(list)
-    numbers = get_number_indexes(lines)
-    for left, right, value in numbers:
-        gear = number_adjacent_to_star(left, right, lines)
-        if gear is None:
-            continue
-        gears[gear].append(value)
+    for left, right, value in schematic.numbers:
+        for gear in number_adjacent_to_stars(left, right, schematic):
+            gears[gear].append(value)
 
     total = 0
     for gear_nums in gears.values():
         if len(gear_nums) == 2:
             total += gear_nums[0] * gear_nums[1]
     return total
+
+
+class PartNumber(NamedTuple):
+    value: int
+    # Where the number starts, and every star next to it
+    position: Coord
+    stars: tuple[Coord, ...]
+
+
+def stars_between(row: bytes, start: int, stop: int, y: int) -> Iterator[Coord]:
+    x = row.find(STAR_BYTES, start, stop)
+    while x != -1:
+        # Rows carry a dot on the front, so x is one past the real column
+        yield Coord(x - 1, y)
+        x = row.find(STAR_BYTES, x + 1, stop)
+
+
+def scan(lines: Iterable[str]) -> Iterator[PartNumber]:
+    # The same part numbers as the grid, for schematics too big to hold. Only
+    # three rows are ever kept, the one being looked at and either side of it,
+    # and the part numbers come out row by row as they're found.
+    window: deque[bytes] = deque(maxlen=3)
+    blank = b""
+    y = -1
+
+    def part_numbers() -> Iterator[PartNumber]:
+        above, row, below = window
+        for number in NUMBER.finditer(row):
+            start, stop = number.start() - 1, number.end() + 1
+            if not any(SYMBOL.search(r, start, stop) for r in window):
+                continue
+            stars = (
+                *stars_between(above, start, stop, y - 1),
+                *stars_between(row, start, stop, y),
+                *stars_between(below, start, stop, y + 1),
+            )
+            yield PartNumber(int(number.group()), Coord(number.start() - 1, y), stars)
+
+    for line in lines:
+        line = line.strip()
+        if line == "":
+            continue
+        if len(window) == 0:
+            blank = b"." * (len(line) + 2)
+            window.append(blank)
+        window.append(b"." + line.encode() + b".")
+        if len(window) == 3:
+            y += 1
+            yield from part_numbers()
+
+    if len(window) > 0:
+        window.append(blank)
+        y += 1
+        yield from part_numbers()
+
+
+def gear_ratios(parts: Iterable[PartNumber]) -> Iterator[int]:
+    # Stars only stay open while a number could still turn up next to them.
+    # Part numbers come in row order, so once one turns up two rows below a
+    # star, that star has all of its numbers.
+    open_stars: dict[Coord, list[int]] = {}
+    y = 0
+    for part in parts:
+        if part.position.y != y:
+            y = part.position.y
+            for star in [s for s in open_stars if s.y < y - 1]:
+                values = open_stars.pop(star)
+                if len(values) == 2:
+                    yield values[0] * values[1]
+        for star in part.stars:
+            open_stars.setdefault(star, []).append(part.value)
+
+    for values in open_stars.values():
+        if len(values) == 2:
+            yield values[0] * values[1]
+
+
+def streamed_part_1(puzzle: PuzzleInput | PuzzleStream) -> int:
+    return sum(part.value for part in scan(puzzle.lines))
+
+
+def streamed_part_2(puzzle: PuzzleInput | PuzzleStream) -> int:
+    return sum(gear_ratios(scan(puzzle.lines)))
@@ -1,7 +1,11 @@
+from collections import deque
 from dataclasses import dataclass
 from typing import Any
 
-from aoc.utils.contents import PuzzleInput
+from aoc.utils.contents import PuzzleInput, PuzzleStream
+from aoc.utils.parallel import map_reduce
+
+STREAMING = True
 
 
 @dataclass
@@ -43,27 +47,29 @@ def card_winners(card: Card) -> int:
     return winning_nums
 
 
-def part_1(puzzle: PuzzleInput) -> Any:
-    cards: list[Card] = []
-    for line in puzzle.lines:
-        cards.append(parse_line(line))
+def line_score(line: str) -> int:
+    return card_score(parse_line(line))
 
-    total = 0
-    for card in cards:
-        total += card_score(card)
-    return total
 
+def part_1(puzzle: PuzzleInput | PuzzleStream) -> Any:
+    return map_reduce(line_score, puzzle.lines)
 
-def part_2(puzzle: PuzzleInput) -> Any:
-    cards: list[Card] = []
+
+def part_2(puzzle: PuzzleInput | PuzzleStream) -> Any:
+    # A card only ever hands out copies to the cards right after it, so we just
+    # need to remember the extra copies owed to the next few cards.
+    extra_copies: deque[int] = deque()
+    total = 0
     for line in puzzle.lines:
-        cards.append(parse_line(line))
+        card = parse_line(line)
+        if len(extra_copies) > 0:
+            card.copies += extra_copies.popleft()
+        total += card.copies
 
-    for card in cards:
         winners = card_winners(card)
-        for i in range(card.id, card.id + winners):
-            copies = card.copies
-            cards[i].copies += copies
-
-    total = sum(map(lambda card: card.copies, cards))
+        for i in range(winners):
+            if i < len(extra_copies):
+                extra_copies[i] += card.copies
+            else:
+                extra_copies.append(card.copies)
     return total
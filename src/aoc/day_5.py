@@ -1,10 +1,10 @@
 from dataclasses import dataclass
 from typing import Any, NamedTuple
 
-from parse import findall, parse
 from tqdm import tqdm
 
 from aoc.utils.contents import PuzzleInput
+from aoc.utils.parsing import int_array
 
 
 class Range(NamedTuple):
@@ -22,18 +22,17 @@ class Allocation:
 def get_allocations(file: str) -> (list[Allocation], list[int]):
     # Get seeds
     chunks = file.strip().split("\n\n")
-    seeds = []
-    for hit in findall("{:d}", chunks[0]):
-        seeds.append(hit.fixed[0])
+    seeds = list(int_array(chunks[0]))
 
     allocations = []
     id = 0
     for chunk in chunks[1:]:
-        lines = chunk.split("\n")
+        # Skip the header, the rest is a wall of (dest, source, length)
+        _, numbers = chunk.split("\n", maxsplit=1)
+        nums = int_array(numbers)
         ranges = []
-        for line in lines[1:]:
-            line_nums = parse("{:d} {:d} {:d}", line).fixed
-            ranges.append(Range(line_nums[0], line_nums[1], line_nums[2]))
+        for i in range(0, len(nums), 3):
+            ranges.append(Range(nums[i], nums[i + 1], nums[i + 2]))
 
         allocations.append(Allocation(id=id, ranges=ranges))
         id += 1
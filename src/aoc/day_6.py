@@ -1,8 +1,9 @@
 from typing import Any, NamedTuple
 
-from parse import findall
+from aoc.utils.contents import PuzzleInput, PuzzleStream
+from aoc.utils.parsing import int_array
 
-from aoc.utils.contents import PuzzleInput
+STREAMING = True
 
 
 class Race(NamedTuple):
@@ -11,12 +12,8 @@ class Race(NamedTuple):
 
 
 def get_races(lines: list[str]) -> list[Race]:
-    times = []
-    for hit in findall("{:d}", lines[0]):
-        times.append(hit.fixed[0])
-    distances = []
-    for hit in findall("{:d}", lines[1]):
-        distances.append(hit.fixed[0])
+    times = int_array(lines[0])
+    distances = int_array(lines[1])
 
     races = []
     for time, distance in zip(times, distances):
@@ -38,8 +35,8 @@ def get_valid_times(race: Race) -> int:
     return total
 
 
-def part_1(puzzle: PuzzleInput) -> Any:
-    races = get_races(puzzle.lines)
+def part_1(puzzle: PuzzleInput | PuzzleStream) -> Any:
+    races = get_races(list(puzzle.lines))
     possible_wins = []
     for race in races:
         possible_wins.append(get_valid_times(race))
@@ -52,20 +49,16 @@ def part_1(puzzle: PuzzleInput) -> Any:
 
 
 def get_race(lines: list[str]) -> Race:
-    times = []
-    for hit in findall("{:d}", lines[0]):
-        times.append(hit.fixed[0])
-    distances = []
-    for hit in findall("{:d}", lines[1]):
-        distances.append(hit.fixed[0])
+    times = int_array(lines[0])
+    distances = int_array(lines[1])
 
     time = int("".join(str(x) for x in times))
     distance = int("".join(str(x) for x in distances))
     return Race(time, distance)
 
 
-def part_2(puzzle: PuzzleInput) -> Any:
-    race = get_race(puzzle.lines)
+def part_2(puzzle: PuzzleInput | PuzzleStream) -> Any:
+    race = get_race(list(puzzle.lines))
     possible_wins = []
     possible_wins.append(get_valid_times(race))
 
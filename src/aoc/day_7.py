@@ -1,7 +1,9 @@
 from enum import IntEnum
 from typing import Any, Counter
 
-from aoc.utils.contents import PuzzleInput
+from aoc.utils.contents import PuzzleInput, PuzzleStream
+
+STREAMING = True
 
 
 class Card(IntEnum):
@@ -105,7 +107,7 @@ def parse_line(line: str) -> tuple[Hand, int]:
     return (Hand(cards), bid)
 
 
-def part_1(puzzle: PuzzleInput) -> Any:
+def part_1(puzzle: PuzzleInput | PuzzleStream) -> Any:
     hands_unordered = list(map(parse_line, puzzle.lines))
     hands_ordered = sorted(hands_unordered, key=lambda x: x[0])
     total = 0
@@ -134,7 +136,7 @@ def parse_line_2(line: str) -> tuple[Hand, int]:
     return (Hand(cards), bid)
 
 
-def part_2(puzzle: PuzzleInput) -> Any:
+def part_2(puzzle: PuzzleInput | PuzzleStream) -> Any:
     hands_unordered = list(map(parse_line_2, puzzle.lines))
     hands_ordered = sorted(hands_unordered, key=lambda x: x[0])
     total = 0
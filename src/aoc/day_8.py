@@ -1,16 +1,20 @@
 import math
 from typing import Any
 
-from parse import parse
-
 from aoc.utils.contents import PuzzleInput
+from aoc.utils.parsing import Format
+
+NODE = Format("{} = ({}, {})")
 
 
 def get_instructions(lines: list[str]) -> tuple[str, dict[str, tuple[str, str]]]:
     instructions = lines[0].strip()
     desert_map: dict[str, tuple[str, str]] = {}
     for line in lines[2:]:
-        node, left, right = parse("{} = ({}, {})", line).fixed
+        parsed = NODE.parse(line)
+        if parsed is None:
+            raise ValueError(f"Not a node: {line!r}")
+        node, left, right = parsed
         desert_map[node] = (left, right)
 
     return instructions, desert_map
@@ -42,8 +46,12 @@ def get_start_nodes(desert_map: dict[str, tuple[str, str]]) -> list[str]:
     return start_nodes
 
 
-def part_1(puzzle: PuzzleInput) -> Any:
-    instructions, desert_map = get_instructions(puzzle.lines)
+def prepare(puzzle: PuzzleInput) -> tuple[str, dict[str, tuple[str, str]]]:
+    return get_instructions(puzzle.lines)
+
+
+def part_1(network: tuple[str, dict[str, tuple[str, str]]]) -> Any:
+    instructions, desert_map = network
     return steps("AAA", "ZZZ", instructions, desert_map)
 
 
@@ -76,6 +84,6 @@ def simultaneous_steps(
     return math.lcm(*times)
 
 
-def part_2(puzzle: PuzzleInput) -> Any:
-    instructions, desert_map = get_instructions(puzzle.lines)
+def part_2(network: tuple[str, dict[str, tuple[str, str]]]) -> Any:
+    instructions, desert_map = network
     return simultaneous_steps(instructions, desert_map)
@@ -1,6 +1,9 @@
 from typing import Any
 
-from aoc.utils.contents import PuzzleInput
+from aoc.utils.contents import PuzzleInput, PuzzleStream
+from aoc.utils.parallel import map_reduce
+
+STREAMING = True
 
 
 def parse_line(line: str) -> list[int]:
@@ -42,13 +45,17 @@ def predict_last(numbers: list[int]) -> int:
     return total
 
 
-def part_1(puzzle: PuzzleInput) -> Any:
-    increases = list(map(parse_line, puzzle.lines))
-    next_nums = list(map(predict_next, increases))
-    return sum(next_nums)
+def line_next(line: str) -> int:
+    return predict_next(parse_line(line))
+
+
+def line_last(line: str) -> int:
+    return predict_last(parse_line(line))
+
+
+def part_1(puzzle: PuzzleInput | PuzzleStream) -> Any:
+    return map_reduce(line_next, puzzle.lines)
 
 
-def part_2(puzzle: PuzzleInput) -> Any:
-    increases = list(map(parse_line, puzzle.lines))
-    last_nums = list(map(predict_last, increases))
-    return sum(last_nums)
+def part_2(puzzle: PuzzleInput | PuzzleStream) -> Any:
+    return map_reduce(line_last, puzzle.lines)
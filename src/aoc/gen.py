@@ -0,0 +1,685 @@
+import argparse
+import math
+import random
+import string
+import sys
+from collections.abc import Callable
+
+from aoc.utils import registry
+from aoc.utils.contents import PuzzleInput
+
+# Takes a size and a seeded Random, returns the text of a valid puzzle input.
+# What the size counts differs per day, see SIZES.
+Generator = Callable[[int, random.Random], str]
+
+GENERATORS: dict[str, Generator] = {}
+SIZES: dict[str, str] = {}
+
+DIGIT_WORDS = ("one", "two", "three", "four", "five", "six", "seven", "eight", "nine")
+
+
+def generator(day: str, size: str) -> Callable[[Generator], Generator]:
+    def register(func: Generator) -> Generator:
+        GENERATORS[day] = func
+        SIZES[day] = size
+        return func
+
+    return register
+
+
+def generate(day: str, size: int, seed: int = 0) -> str:
+    day = registry.normalize_day(day)
+    if day not in GENERATORS:
+        raise ValueError("Unknown day!")
+    return GENERATORS[day](size, random.Random(seed))
+
+
+def generate_puzzle(day: str, size: int, seed: int = 0) -> PuzzleInput:
+    return PuzzleInput.from_text(generate(day, size, seed))
+
+
+def _lines(lines: list[str]) -> str:
+    return "\n".join(lines) + "\n"
+
+
+def _letters(rng: random.Random, length: int) -> str:
+    return "".join(rng.choices(string.ascii_lowercase, k=length))
+
+
+def _names(
+    rng: random.Random, count: int, length: int, taken: set[str] | None = None
+) -> list[str]:
+    taken = set() if taken is None else set(taken)
+    names: list[str] = []
+    while len(names) < count:
+        name = _letters(rng, length)
+        if name not in taken:
+            taken.add(name)
+            names.append(name)
+    return names
+
+
+def _primes(limit: int) -> list[int]:
+    sieve = [True] * (limit + 1)
+    primes = []
+    for number in range(2, limit + 1):
+        if sieve[number]:
+            primes.append(number)
+            for multiple in range(number * number, limit + 1, number):
+                sieve[multiple] = False
+    return primes
+
+
+def _grid(size: int, rng: random.Random, tiles: str, weights: list[float]) -> str:
+    return _lines(["".join(rng.choices(tiles, weights, k=size)) for _ in range(size)])
+
+
+def _skyline(columns: int, height: int, rng: random.Random) -> list[tuple[int, int]]:
+    # A run of cells per column, each overlapping the previous column's run. The
+    # outline of that is a single closed loop which never touches itself.
+    low: list[int] = []
+    high: list[int] = []
+    for _ in range(columns):
+        if len(low) == 0:
+            bottom = rng.randint(0, height - 1)
+            top = rng.randint(bottom + 1, height)
+        else:
+            bottom = rng.randint(0, high[-1] - 1)
+            top = rng.randint(max(bottom, low[-1]) + 1, height)
+        low.append(bottom)
+        high.append(top)
+
+    points = []
+    for column in range(columns):
+        points.append((column, low[column]))
+        points.append((column + 1, low[column]))
+    for column in reversed(range(columns)):
+        points.append((column + 1, high[column]))
+        points.append((column, high[column]))
+
+    points = [point for i, point in enumerate(points) if point != points[i - 1]]
+    corners = []
+    for i, (x, y) in enumerate(points):
+        before = points[i - 1]
+        after = points[(i + 1) % len(points)]
+        if not (before[0] == x == after[0] or before[1] == y == after[1]):
+            corners.append((x, y))
+    return corners
+
+
+def _walk(corners: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    # Every lattice point along the outline, one step at a time
+    points = []
+    for i, (x, y) in enumerate(corners):
+        end_x, end_y = corners[(i + 1) % len(corners)]
+        step_x = (end_x > x) - (end_x < x)
+        step_y = (end_y > y) - (end_y < y)
+        while (x, y) != (end_x, end_y):
+            points.append((x, y))
+            x, y = x + step_x, y + step_y
+    return points
+
+
+@generator("day_1", "lines")
+def day_1(size: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(size):
+        pieces = [str(rng.randint(1, 9))]
+        for _ in range(rng.randint(1, 6)):
+            roll = rng.random()
+            if roll < 0.3:
+                pieces.append(str(rng.randint(1, 9)))
+            elif roll < 0.6:
+                pieces.append(rng.choice(DIGIT_WORDS))
+            else:
+                pieces.append(_letters(rng, rng.randint(1, 5)))
+        rng.shuffle(pieces)
+        lines.append("".join(pieces))
+    return _lines(lines)
+
+
+@generator("day_2", "games")
+def day_2(size: int, rng: random.Random) -> str:
+    lines = []
+    for game in range(1, size + 1):
+        pulls = []
+        for _ in range(rng.randint(1, 6)):
+            colours = rng.sample(("red", "green", "blue"), rng.randint(1, 3))
+            pulls.append(", ".join(f"{rng.randint(1, 20)} {c}" for c in colours))
+        lines.append(f"Game {game}: {'; '.join(pulls)}")
+    return _lines(lines)
+
+
+@generator("day_3", "grid side")
+def day_3(size: int, rng: random.Random) -> str:
+    rows = []
+    for _ in range(size):
+        row: list[str] = []
+        while len(row) < size:
+            roll = rng.random()
+            if roll < 0.1:
+                row.extend(str(rng.randint(1, 999))[: size - len(row)])
+                if len(row) < size:
+                    row.append(".")
+            elif roll < 0.16:
+                row.append(rng.choice("***#+$/@=%&-"))
+            else:
+                row.append(".")
+        rows.append("".join(row))
+    return _lines(rows)
+
+
+@generator("day_4", "cards")
+def day_4(size: int, rng: random.Random) -> str:
+    width = len(str(size))
+    lines = []
+    for card in range(1, size + 1):
+        winning = rng.sample(range(1, 100), 10)
+        others = [number for number in range(1, 100) if number not in winning]
+        # Cards can't win copies of cards past the end of the table
+        matches = min(int(rng.expovariate(0.4)), 10, size - card)
+        numbers = rng.sample(winning, matches) + rng.sample(others, 25 - matches)
+        rng.shuffle(numbers)
+        lines.append(
+            f"Card {card:>{width}}: {' '.join(f'{n:>2}' for n in winning)}"
+            f" | {' '.join(f'{n:>2}' for n in numbers)}"
+        )
+    return _lines(lines)
+
+
+@generator("day_5", "ranges per map, and the longest seed range")
+def day_5(size: int, rng: random.Random) -> str:
+    top = 1 << 32
+    seeds: list[int] = []
+    for _ in range(10):
+        length = rng.randint(1, size)
+        seeds.extend((rng.randrange(top - length), length))
+
+    categories = (
+        "seed",
+        "soil",
+        "fertilizer",
+        "water",
+        "light",
+        "temperature",
+        "humidity",
+        "location",
+    )
+    chunks = [f"seeds: {' '.join(map(str, seeds))}"]
+    for source, destination in zip(categories, categories[1:]):
+        bounds = sorted(rng.sample(range(top), 2 * size))
+        lines = [f"{source}-to-{destination} map:"]
+        for start, end in zip(bounds[::2], bounds[1::2]):
+            length = end - start
+            lines.append(f"{rng.randrange(top - length)} {start} {length}")
+        chunks.append("\n".join(lines))
+    return "\n\n".join(chunks) + "\n"
+
+
+@generator("day_6", "races")
+def day_6(size: int, rng: random.Random) -> str:
+    times = [rng.randint(7, 99) for _ in range(size)]
+    # Always beatable, holding for half the race is the best you can do
+    distances = [rng.randrange((t // 2) * (t - t // 2)) for t in times]
+    return _lines(
+        [
+            "Time:    " + "".join(f"{t:>7}" for t in times),
+            "Distance:" + "".join(f"{d:>7}" for d in distances),
+        ]
+    )
+
+
+@generator("day_7", "hands")
+def day_7(size: int, rng: random.Random) -> str:
+    hands: set[str] = set()
+    while len(hands) < min(size, 13**5):
+        hands.add("".join(rng.choices("23456789TJQKA", k=5)))
+    return _lines([f"{hand} {rng.randint(1, 1000)}" for hand in hands])
+
+
+@generator("day_8", "nodes")
+def day_8(size: int, rng: random.Random) -> str:
+    # Every ghost walks a loop of length*prime nodes, with its Z at the end. The
+    # loop is a multiple of the instructions, so each node is always left with
+    # the same instruction. The other way leads to some random node.
+    ghosts = min(6, max(1, size // 16))
+    budget = max(2, size // ghosts)
+    length = math.isqrt(budget)
+    target = max(2, budget // length)
+    primes = sorted(_primes(2 * target + 20), key=lambda p: abs(p - target))
+    primes = rng.sample(primes[: 2 * ghosts], ghosts)
+    instructions = "".join(rng.choices("LR", k=length))
+
+    total = sum(length * prime + 1 for prime in primes)
+    name_length = 3
+    while 24 * 26 ** (name_length - 1) < 2 * total:
+        name_length += 1
+    middle = sorted(set(string.ascii_uppercase) - {"A", "Z"})
+    names = {"AAA", "ZZZ"}
+
+    def new_name(last: list[str]) -> str:
+        while True:
+            name = "".join(rng.choices(string.ascii_uppercase, k=name_length - 1))
+            name += rng.choice(last)
+            if name not in names:
+                names.add(name)
+                return name
+
+    nodes: dict[str, list[str]] = {}
+    for ghost, prime in enumerate(primes):
+        steps = length * prime
+        start = "AAA" if ghost == 0 else new_name(["A"])
+        chain = [new_name(middle) for _ in range(steps - 1)]
+        chain.append("ZZZ" if ghost == 0 else new_name(["Z"]))
+        walk = [start, *chain]
+        for step, name in enumerate(walk):
+            following = chain[step % steps]
+            other = rng.choice(walk)
+            if instructions[step % length] == "L":
+                nodes[name] = [following, other]
+            else:
+                nodes[name] = [other, following]
+
+    order = list(nodes)
+    rng.shuffle(order)
+    lines = [instructions, ""]
+    lines.extend(f"{name} = ({nodes[name][0]}, {nodes[name][1]})" for name in order)
+    return _lines(lines)
+
+
+@generator("day_9", "histories")
+def day_9(size: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(size):
+        coefficients = [rng.randint(-5, 5) for _ in range(rng.randint(1, 6))]
+        offset = rng.randint(-5, 5)
+        values = [
+            sum(c * (x + offset) ** i for i, c in enumerate(coefficients))
+            for x in range(21)
+        ]
+        lines.append(" ".join(map(str, values)))
+    return _lines(lines)
+
+
+@generator("day_10", "grid side")
+def day_10(size: int, rng: random.Random) -> str:
+    size = max(size, 5)
+    cells = (size - 3) // 2
+    outline = _walk(_skyline(cells, cells, rng))
+    # Spread the loop out, so there's always a gap between two stretches of pipe
+    loop = []
+    for i, (x, y) in enumerate(outline):
+        after_x, after_y = outline[(i + 1) % len(outline)]
+        loop.append((2 * x + 1, 2 * y + 1))
+        loop.append((x + after_x + 1, y + after_y + 1))
+
+    grid = [rng.choices("|-LJ7F.", k=size) for _ in range(size)]
+    pipes = {
+        frozenset(((0, -1), (0, 1))): "|",
+        frozenset(((-1, 0), (1, 0))): "-",
+        frozenset(((0, -1), (1, 0))): "L",
+        frozenset(((0, -1), (-1, 0))): "J",
+        frozenset(((0, 1), (-1, 0))): "7",
+        frozenset(((0, 1), (1, 0))): "F",
+    }
+    for i, (x, y) in enumerate(loop):
+        before = loop[i - 1]
+        after = loop[(i + 1) % len(loop)]
+        sides = frozenset(
+            ((before[0] - x, before[1] - y), (after[0] - x, after[1] - y))
+        )
+        grid[y][x] = pipes[sides]
+
+    start = rng.randrange(len(loop))
+    x, y = loop[start]
+    grid[y][x] = "S"
+    connected = {loop[start - 1], loop[(start + 1) % len(loop)]}
+    # Stray pipes next to the start mustn't look like they join it
+    for dx, dy in ((0, -1), (0, 1), (-1, 0), (1, 0)):
+        if (x + dx, y + dy) not in connected:
+            grid[y + dy][x + dx] = "."
+    return _lines(["".join(row) for row in grid])
+
+
+@generator("day_11", "galaxies")
+def day_11(size: int, rng: random.Random) -> str:
+    side = max(4, math.isqrt(size * 50))
+    # Leave some rows and columns empty, so the universe has something to expand
+    rows = rng.sample(range(side), max(1, side * 9 // 10))
+    columns = rng.sample(range(side), max(1, side * 9 // 10))
+    count = min(size, len(rows) * len(columns))
+    galaxies: set[tuple[int, int]] = set()
+    while len(galaxies) < count:
+        galaxies.add((rng.choice(columns), rng.choice(rows)))
+
+    grid = [["."] * side for _ in range(side)]
+    for x, y in galaxies:
+        grid[y][x] = "#"
+    return _lines(["".join(row) for row in grid])
+
+
+@generator("day_12", "rows")
+def day_12(size: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(size):
+        springs = rng.choices("#.", k=rng.randint(4, 20))
+        springs[rng.randrange(len(springs))] = "#"
+        counts = [len(run) for run in "".join(springs).split(".") if len(run) > 0]
+        hidden = "".join("?" if rng.random() < 0.5 else c for c in springs)
+        lines.append(f"{hidden} {','.join(map(str, counts))}")
+    return _lines(lines)
+
+
+@generator("day_13", "patterns")
+def day_13(size: int, rng: random.Random) -> str:
+    # Mirrored around a column and around a row. The smudge sits somewhere the
+    # column's reflection doesn't reach, so only the row one gets broken by it.
+    patterns = []
+    for _ in range(size):
+        width = rng.randint(5, 17)
+        height = rng.randint(4, 17)
+        column = rng.randint(1, (width - 1) // 2)
+        row = rng.randint(1, height // 2)
+
+        def line() -> list[str]:
+            left = rng.choices("#.", k=column)
+            return left + left[::-1] + rng.choices("#.", k=width - 2 * column)
+
+        top = [line() for _ in range(row)]
+        grid = top + [list(r) for r in reversed(top)]
+        grid += [line() for _ in range(height - 2 * row)]
+        x = rng.randrange(2 * column, width)
+        y = rng.randrange(2 * row)
+        grid[y][x] = "." if grid[y][x] == "#" else "#"
+        patterns.append("\n".join("".join(r) for r in grid))
+    return "\n\n".join(patterns) + "\n"
+
+
+@generator("day_14", "grid side")
+def day_14(size: int, rng: random.Random) -> str:
+    return _grid(size, rng, "O#.", [0.2, 0.15, 0.65])
+
+
+@generator("day_15", "steps")
+def day_15(size: int, rng: random.Random) -> str:
+    labels = [_letters(rng, rng.randint(2, 6)) for _ in range(max(1, size // 4))]
+    steps = []
+    for _ in range(size):
+        label = rng.choice(labels)
+        if rng.random() < 0.3:
+            steps.append(f"{label}-")
+        else:
+            steps.append(f"{label}={rng.randint(1, 9)}")
+    return ",".join(steps) + "\n"
+
+
+@generator("day_16", "grid side")
+def day_16(size: int, rng: random.Random) -> str:
+    return _grid(size, rng, ".\\/|-", [0.9, 0.025, 0.025, 0.025, 0.025])
+
+
+@generator("day_17", "grid side")
+def day_17(size: int, rng: random.Random) -> str:
+    return _grid(size, rng, "123456789", [1.0] * 9)
+
+
+@generator("day_18", "columns of the lagoon")
+def day_18(size: int, rng: random.Random) -> str:
+    corners = _skyline(size, size, rng)
+    # The same shape twice, at two scales. Part 2's lengths have to fit in five
+    # hex digits.
+    small_x = [0]
+    large_x = [0]
+    for _ in range(size):
+        small_x.append(small_x[-1] + rng.randint(1, 10))
+        large_x.append(large_x[-1] + rng.randint(1, 0xFFFFF // size))
+    small_y = [0]
+    large_y = [0]
+    for _ in range(size):
+        small_y.append(small_y[-1] + rng.randint(1, 10))
+        large_y.append(large_y[-1] + rng.randint(1, 0xFFFFF // size))
+
+    # Go round the shape so that the shoelace sum comes out positive
+    area = 0
+    for i, (x, y) in enumerate(corners):
+        after_x, after_y = corners[(i + 1) % len(corners)]
+        area += x * after_y - y * after_x
+    if area < 0:
+        corners.reverse()
+
+    lines = []
+    for i, (x, y) in enumerate(corners):
+        after_x, after_y = corners[(i + 1) % len(corners)]
+        if after_x > x:
+            direction, digit = "R", 0
+        elif after_x < x:
+            direction, digit = "L", 2
+        elif after_y > y:
+            direction, digit = "D", 1
+        else:
+            direction, digit = "U", 3
+        if direction in "RL":
+            small = abs(small_x[after_x] - small_x[x])
+            large = abs(large_x[after_x] - large_x[x])
+        else:
+            small = abs(small_y[after_y] - small_y[y])
+            large = abs(large_y[after_y] - large_y[y])
+        lines.append(f"{direction} {small} (#{large:05x}{digit})")
+    return _lines(lines)
+
+
+@generator("day_19", "workflows, and as many parts")
+def day_19(size: int, rng: random.Random) -> str:
+    # A tree, like the real thing. Every workflow is sent to from exactly one rule.
+    names = ["in", *_names(rng, size - 1, 3, {"in"})]
+    used = 1
+    queue = ["in"]
+    workflows = []
+    while len(queue) > 0:
+        name = queue.pop(0)
+        targets: list[str] = []
+        for _ in range(rng.randint(2, 4)):
+            must_branch = len(queue) == 0 and len(targets) == 0
+            if used < len(names) and (must_branch or rng.random() < 0.5):
+                targets.append(names[used])
+                queue.append(names[used])
+                used += 1
+            else:
+                targets.append(rng.choice("AR"))
+        rules = [
+            f"{rng.choice('xmas')}{rng.choice('<>')}{rng.randint(1, 4000)}:{target}"
+            for target in targets[:-1]
+        ]
+        workflows.append(f"{name}{{{','.join([*rules, targets[-1]])}}}")
+
+    rng.shuffle(workflows)
+    parts = [
+        "{" + ",".join(f"{c}={rng.randint(1, 4000)}" for c in "xmas") + "}"
+        for _ in range(size)
+    ]
+    return "\n".join(workflows) + "\n\n" + _lines(parts)
+
+
+@generator("day_20", "flip-flops per counter")
+def day_20(size: int, rng: random.Random) -> str:
+    # Four binary counters, each with a conjunction that fires once it reaches
+    # its target and resets it. Part 2 looks for these by name.
+    bits = max(4, size)
+    hubs = ["rb", "gp", "ml", "bt"]
+    targets = rng.sample(range(2 ** (bits - 1) + 1, 2**bits, 2), len(hubs))
+    names = iter(_names(rng, len(hubs) * (bits + 1) + 1, 2, {*hubs, "rx"}))
+    final = next(names)
+
+    lines = []
+    firsts = []
+    for hub, target in zip(hubs, targets):
+        flip_flops = [next(names) for _ in range(bits)]
+        firsts.append(flip_flops[0])
+        inverter = next(names)
+        for bit, flip_flop in enumerate(flip_flops):
+            outputs = flip_flops[bit + 1 : bit + 2]
+            if target >> bit & 1:
+                outputs.append(hub)
+            lines.append(f"%{flip_flop} -> {', '.join(outputs)}")
+        resets = [f for bit, f in enumerate(flip_flops) if not target >> bit & 1]
+        lines.append(f"&{hub} -> {', '.join([*resets, flip_flops[0], inverter])}")
+        lines.append(f"&{inverter} -> {final}")
+    lines.append(f"&{final} -> rx")
+    lines.append(f"broadcaster -> {', '.join(firsts)}")
+    rng.shuffle(lines)
+    return _lines(lines)
+
+
+@generator("day_21", "grid side (part 2 only makes sense at 131)")
+def day_21(size: int, rng: random.Random) -> str:
+    size = max(size, 3) | 1
+    middle = size // 2
+    grid = [rng.choices(".#", [0.85, 0.15], k=size) for _ in range(size)]
+    # Like the real input, the edges and the lines through the start are clear
+    for i in range(size):
+        for x, y in ((i, 0), (i, size - 1), (0, i), (size - 1, i), (i, middle)):
+            grid[y][x] = "."
+        grid[i][middle] = "."
+    grid[middle][middle] = "S"
+    return _lines(["".join(row) for row in grid])
+
+
+@generator("day_22", "bricks")
+def day_22(size: int, rng: random.Random) -> str:
+    occupied: set[tuple[int, int, int]] = set()
+    lines = []
+    for _ in range(size):
+        axis = rng.randrange(3)
+        start = [rng.randint(0, 9), rng.randint(0, 9), rng.randint(1, size // 4 + 10)]
+        end = list(start)
+        end[axis] += rng.randint(0, 3)
+        end[0] = min(end[0], 9)
+        end[1] = min(end[1], 9)
+        while True:
+            cubes = {
+                (x, y, z)
+                for x in range(start[0], end[0] + 1)
+                for y in range(start[1], end[1] + 1)
+                for z in range(start[2], end[2] + 1)
+            }
+            if occupied.isdisjoint(cubes):
+                break
+            start[2] += 1
+            end[2] += 1
+        occupied.update(cubes)
+        lines.append(f"{start[0]},{start[1]},{start[2]}~{end[0]},{end[1]},{end[2]}")
+    return _lines(lines)
+
+
+@generator("day_23", "junctions per side")
+def day_23(size: int, rng: random.Random) -> str:
+    # A lattice of junctions, with the slopes pointing right and down. Some of
+    # the corridors going right take a detour down, so paths differ in length.
+    size = max(size, 2)
+    xs = [1]
+    ys = [1]
+    for _ in range(size - 1):
+        xs.append(xs[-1] + rng.randint(4, 12))
+        ys.append(ys[-1] + rng.randint(4, 12))
+    grid = [["#"] * (xs[-1] + 2) for _ in range(ys[-1] + 3)]
+
+    def carve(cells: list[tuple[int, int]]) -> None:
+        for x, y in cells:
+            grid[y][x] = "."
+
+    grid[0][1] = "."
+    carve([(xs[-1], ys[-1] + 1), (xs[-1], ys[-1] + 2)])
+    for row, y in enumerate(ys):
+        for column, x in enumerate(xs):
+            grid[y][x] = "."
+            if row + 1 < len(ys):
+                below = ys[row + 1]
+                carve([(x, i) for i in range(y + 2, below - 1)])
+                grid[y + 1][x] = grid[below - 1][x] = "v"
+            if column + 1 == len(xs):
+                continue
+
+            right = xs[column + 1]
+            grid[y][x + 1] = grid[y][right - 1] = ">"
+            if row + 1 == len(ys) or right - x < 6 or rng.random() < 0.3:
+                carve([(i, y) for i in range(x + 2, right - 1)])
+                continue
+            depth = rng.randint(1, ys[row + 1] - y - 2)
+            down = rng.randint(x + 2, right - 4)
+            up = rng.randint(down + 2, right - 2)
+            carve([(i, y) for i in range(x + 2, down)])
+            carve([(down, i) for i in range(y, y + depth)])
+            carve([(i, y + depth) for i in range(down, up)])
+            carve([(up, i) for i in range(y + 1, y + depth + 1)])
+            carve([(i, y) for i in range(up, right - 1)])
+    return _lines(["".join(row) for row in grid])
+
+
+@generator("day_24", "hailstones")
+def day_24(size: int, rng: random.Random) -> str:
+    # Work backwards from a rock that hits every hailstone at a whole time
+    rock = [rng.randint(10**14, 3 * 10**14) for _ in range(3)]
+    rock_velocity = [rng.randint(-250, 250) for _ in range(3)]
+    times = rng.sample(range(1, 10**11), size)
+    lines = []
+    for time in times:
+        velocity = [rng.randint(-300, 300) for _ in range(3)]
+        if velocity[0] == 0:
+            velocity[0] = 1
+        position = [
+            p + (v - h) * time for p, v, h in zip(rock, rock_velocity, velocity)
+        ]
+        lines.append(
+            f"{', '.join(map(str, position))} @ {', '.join(map(str, velocity))}"
+        )
+    return _lines(lines)
+
+
+@generator("day_25", "components")
+def day_25(size: int, rng: random.Random) -> str:
+    # Two well connected halves, joined by exactly three wires
+    names = _names(rng, max(size, 8), 3)
+    halves = names[: len(names) // 2], names[len(names) // 2 :]
+    wires: set[tuple[str, str]] = set()
+    for half in halves:
+        for i, name in enumerate(half):
+            for other in [half[i - 1], *rng.sample(half, min(3, len(half)))]:
+                if other != name:
+                    wires.add((min(name, other), max(name, other)))
+    for left, right in zip(rng.sample(halves[0], 3), rng.sample(halves[1], 3)):
+        wires.add((min(left, right), max(left, right)))
+
+    connections: dict[str, list[str]] = {}
+    for left, right in sorted(wires):
+        connections.setdefault(left, []).append(right)
+    return _lines(
+        [f"{name}: {' '.join(others)}" for name, others in connections.items()]
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="AOC gen", description="Generate puzzle inputs of any size"
+    )
+    parser.add_argument("day", help="The day to generate an input for.")
+    parser.add_argument("-s", "--size", type=int, default=100, help="How big.")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+    parser.add_argument(
+        "-o", "--output", default=None, help="Where to write it, default stdout."
+    )
+
+    args = parser.parse_args(argv)
+    day = registry.normalize_day(args.day)
+    if day not in GENERATORS:
+        parser.error(f"No generator for {day}.")
+    if args.size < 1:
+        parser.error("Size has to be at least 1.")
+
+    text = generate(day, args.size, args.seed)
+    if args.output is None:
+        sys.stdout.write(text)
+    else:
+        with open(args.output, "w") as file:
+            file.write(text)
+        print(f"Wrote {day} ({SIZES[day]}: {args.size}) to {args.output}")
+    return 0
@@ -0,0 +1,209 @@
+import argparse
+import inspect
+import json
+import math
+import statistics
+import sys
+from collections.abc import Callable
+from timeit import default_timer as timer
+from types import ModuleType
+from typing import Any
+
+from aoc.utils import registry, runner
+from aoc.utils.profiling import MemoryTracer
+
+PARTS = ("part_1", "part_2")
+# Parts quicker than this are mostly noise, whatever their ratio to the baseline
+MIN_TIME = 0.002
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    # Nearest-rank, good enough for a handful of repeats
+    ordered = sorted(samples)
+    rank = math.ceil(pct / 100 * len(ordered))
+    return ordered[max(rank, 1) - 1]
+
+
+def summarize(samples: list[float]) -> dict[str, Any]:
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "p95": percentile(samples, 95),
+        "runs": samples,
+    }
+
+
+def clear_caches(module: ModuleType) -> None:
+    # Several days memoise with lru_cache, which would make every repeat after
+    # the first one look free.
+    for _, obj in inspect.getmembers(module):
+        if hasattr(obj, "cache_clear"):
+            obj.cache_clear()
+        if inspect.isclass(obj) and obj.__module__ == module.__name__:
+            for _, method in inspect.getmembers(obj):
+                if hasattr(method, "cache_clear"):
+                    method.cache_clear()
+
+
+def time_call(func: Callable[[Any], Any], arg: Any) -> float:
+    start = timer()
+    func(arg)
+    return timer() - start
+
+
+def bench_day(
+    day: str,
+    test: bool = False,
+    warmup: int = 1,
+    repeat: int = 5,
+    memory: bool = False,
+    stream: bool = False,
+) -> dict[str, Any]:
+    module = registry.load_day(day)
+    path = runner.input_path(day, test)
+
+    phases = ("parse", *PARTS) if runner.has_prepare(module, stream) else PARTS
+    funcs = runner.parts(module, stream)
+    samples: dict[str, list[float]] = {phase: [] for phase in phases}
+    for i in range(warmup + repeat):
+        # Fresh input every time, some days modify the puzzle they're given
+        puzzle = runner.load_puzzle(module, path, stream=stream)
+        clear_caches(module)
+
+        start = timer()
+        state = runner.prepare(module, puzzle, stream)
+        elapsed = {"parse": timer() - start}
+        for part, func in zip(PARTS, funcs):
+            elapsed[part] = time_call(func, state)
+
+        if i >= warmup:
+            for phase in phases:
+                samples[phase].append(elapsed[phase])
+
+    results = {phase: summarize(samples[phase]) for phase in phases}
+    if memory:
+        # Separate run, tracemalloc slows everything down far too much to time
+        clear_caches(module)
+        tracer = MemoryTracer(day, verbose=False)
+        runner.solve_day(day, test, hook=tracer, stream=stream)
+        for phase, peak in tracer.peaks.items():
+            results[phase]["peak_bytes"] = peak
+    return results
+
+
+def compare(
+    results: dict[str, Any], baseline: dict[str, Any], threshold: float
+) -> list[tuple[str, str, str, float]]:
+    regressions = []
+    for day, parts in results["days"].items():
+        if day not in baseline["days"]:
+            continue
+        for part, stats in parts.items():
+            old = baseline["days"][day].get(part)
+            if old is None:
+                continue
+            for metric in ("median", "peak_bytes"):
+                if stats.get(metric) is None or not old.get(metric):
+                    continue
+                if metric == "median" and stats[metric] < MIN_TIME:
+                    continue
+                ratio = stats[metric] / old[metric]
+                if ratio > 1 + threshold:
+                    regressions.append((day, part, metric, ratio))
+    return regressions
+
+
+def print_results(results: dict[str, Any], baseline: dict[str, Any] | None) -> None:
+    print(
+        f"{'Day':<8} {'Part':<7} {'Min':>10} {'Median':>10} {'p95':>10}"
+        f" {'vs base':>8} {'Peak MiB':>10}"
+    )
+    for day, parts in results["days"].items():
+        for part, stats in parts.items():
+            change = ""
+            if baseline is not None and day in baseline["days"]:
+                old = baseline["days"][day].get(part)
+                if old is not None and old["median"] > 0:
+                    change = f"{stats['median'] / old['median']:.2f}x"
+            peak = ""
+            if "peak_bytes" in stats:
+                peak = f"{stats['peak_bytes'] / 2**20:.2f}"
+            print(
+                f"{day:<8} {part:<7} {stats['min']:>10.4f} {stats['median']:>10.4f}"
+                f" {stats['p95']:>10.4f} {change:>8} {peak:>10}"
+            )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="AOC bench", description="Benchmark the Advent of Code solvers"
+    )
+    parser.add_argument("days", nargs="*", help="The day(s) to run, default all.")
+    parser.add_argument(
+        "-t", "--test", action="store_true", help="Use the test input instead."
+    )
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed runs.")
+    parser.add_argument("-n", "--repeat", type=int, default=5, help="Timed runs.")
+    parser.add_argument(
+        "-o", "--output", default="bench.json", help="Where to write the results."
+    )
+    parser.add_argument(
+        "-b", "--baseline", default=None, help="Earlier results to compare against."
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Relative slowdown (or memory growth) that counts as a regression.",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="Also record the peak traced memory of every phase.",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Bench a day's streaming mode, for days that have one.",
+    )
+
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error("Need at least one repeat.")
+    days = [registry.normalize_day(day) for day in args.days]
+    if len(days) == 0:
+        days = registry.available_days()
+
+    results: dict[str, Any] = {
+        "test": args.test,
+        "warmup": args.warmup,
+        "repeat": args.repeat,
+        "stream": args.stream,
+        "python": sys.version,
+        "days": {},
+    }
+    for day in days:
+        print(f"Benchmarking {day}...", file=sys.stderr)
+        results["days"][day] = bench_day(
+            day, args.test, args.warmup, args.repeat, args.memory, args.stream
+        )
+
+    with open(args.output, "w") as file:
+        json.dump(results, file, indent=2)
+
+    baseline = None
+    if args.baseline is not None:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+
+    print_results(results, baseline)
+    if baseline is None:
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    if len(regressions) > 0:
+        print()
+        for day, part, metric, ratio in regressions:
+            print(f"REGRESSION: {day} {part} {metric} is {ratio:.2f}x the baseline")
+        return 1
+    return 0
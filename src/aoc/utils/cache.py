@@ -0,0 +1,98 @@
+import hashlib
+import importlib.util
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import aoc.utils
+
+
+def file_digest(path: str | Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        while chunk := file.read(1 << 20):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def source_digest(day: str) -> str:
+    # The day itself plus the shared helpers it leans on, so that changing
+    # something like a_star invalidates the days that use it too.
+    spec = importlib.util.find_spec(f"aoc.{day}")
+    if spec is None or spec.origin is None:
+        raise ValueError("Unknown day!")
+    sources = [Path(spec.origin)]
+    sources.extend(sorted(Path(aoc.utils.__file__).parent.glob("*.py")))
+
+    digest = hashlib.sha256()
+    for source in sources:
+        digest.update(source.name.encode())
+        digest.update(file_digest(source).encode())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    def __init__(self, path: Path, max_entries: int = 256) -> None:
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        try:
+            with open(path) as file:
+                stored = json.load(file)
+        except (OSError, ValueError):
+            stored = {}
+        # Oldest first, a hit moves an entry to the back
+        self.entries: dict[str, Any] = stored.get("entries", {})
+        self.total_hits: int = stored.get("hits", 0)
+        self.total_misses: int = stored.get("misses", 0)
+
+    @staticmethod
+    def key(day: str, input_path: str) -> str:
+        return f"{day}:{file_digest(input_path)}:{source_digest(day)}"
+
+    def get(self, key: str) -> tuple[Any, Any] | None:
+        if key not in self.entries:
+            self.misses += 1
+            return None
+        self.hits += 1
+        entry = self.entries.pop(key)
+        self.entries[key] = entry
+        return entry["part_1"], entry["part_2"]
+
+    def put(self, key: str, part_1: Any, part_2: Any) -> None:
+        entry = {"part_1": part_1, "part_2": part_2}
+        try:
+            json.dumps(entry)
+        except (TypeError, ValueError):
+            # Answers we can't store faithfully just don't get cached
+            return
+
+        self.entries.pop(key, None)
+        self.entries[key] = entry
+        while len(self.entries) > self.max_entries:
+            del self.entries[next(iter(self.entries))]
+
+    @property
+    def lifetime_hits(self) -> int:
+        return self.total_hits + self.hits
+
+    @property
+    def lifetime_misses(self) -> int:
+        return self.total_misses + self.misses
+
+    def save(self) -> None:
+        stored = {
+            "hits": self.lifetime_hits,
+            "misses": self.lifetime_misses,
+            "entries": self.entries,
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename, so an interrupted run can't leave half a file
+        handle, temp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        with os.fdopen(handle, "w") as file:
+            json.dump(stored, file)
+        os.replace(temp_path, self.path)
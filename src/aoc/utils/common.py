@@ -1,8 +1,10 @@
 import heapq
-from collections import defaultdict
-from collections.abc import Iterator
+import math
+from collections.abc import Callable, Container, Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
 from enum import Enum
-from typing import NamedTuple, Protocol, TypeVar
+from typing import Any, Generic, NamedTuple, TypeVar
 
 
 class Coord(NamedTuple):
@@ -20,58 +22,370 @@ class Direction(Enum):
     WEST = Coord(-1, 0)
 
 
-T = TypeVar("T")
+class Packer(NamedTuple):
+    # Packs coordinates into single ints, y * width + x, which hash and compare
+    # far quicker than a Coord and take a fraction of the memory in a set.
+    # Only x in range(width) survives the round trip, so shift the origin by a
+    # multiple of the width for planes that go negative.
+    width: int
+
+    def pack(self, coord: Coord) -> int:
+        return coord.y * self.width + coord.x
 
+    def unpack(self, packed: int) -> Coord:
+        y, x = divmod(packed, self.width)
+        return Coord(x, y)
 
-class Heuristic(Protocol):
-    def __call__(self, current: T, goal: T) -> float:
-        ...
+    def offset(self, direction: Direction) -> int:
+        return direction.value.y * self.width + direction.value.x
 
+    def add(self, packed: int, direction: Direction) -> int:
+        return packed + self.offset(direction)
 
-class Cost(Protocol):
-    def __call__(self, paths: dict[T, T], current: T, last: T) -> float:
-        ...
+    def neighbors(self, packed: int) -> tuple[int, int, int, int]:
+        # North, east, south, west
+        return packed - self.width, packed + 1, packed + self.width, packed - 1
 
+    def in_bounds(self, packed: int, height: int) -> bool:
+        # Only rows can be told apart, a step east off the last column lands on
+        # the first column of the next row. Leave a spare column where it matters.
+        return 0 <= packed < self.width * height
 
-class Neighbors(Protocol):
-    def __call__(self, current: T, paths: dict[T, T]) -> Iterator[T]:
-        ...
+
+T = TypeVar("T")
 
 
-def _reconstruct_path(paths: dict[T, T], start: T, goal: T) -> list[T]:
+# What the search functions take, as plain callables so that any function of
+# the right shape will do
+CostFunc = Callable[[dict[T, T], T, T], float]
+NeighborFunc = Callable[[T, dict[T, T]], Iterator[T]]
+
+
+def _reconstruct_path(paths: dict[T, T], starts: Container[T], goal: T) -> list[T]:
     path = [goal]
     current = goal
-    while current in paths.keys():
-        path.insert(0, paths[current])
+    while current in paths:
         current = paths[current]
-        if current == start:
+        path.append(current)
+        if current in starts:
             break
+    path.reverse()
     return path
 
 
-def a_star(
-    start: T, goal: T, heuristic: Heuristic, cost_func: Cost, next_func: Neighbors
-) -> tuple[list[T], float]:
-    frontier: list[tuple[float, T]] = []
-    heapq.heappush(frontier, (heuristic(start, goal), start))
+class _HeapQueue(Generic[T]):
+    def __init__(self) -> None:
+        self.heap: list[tuple[float, T]] = []
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def push(self, priority: float, item: T) -> None:
+        heapq.heappush(self.heap, (priority, item))
+
+    def pop(self) -> T:
+        return heapq.heappop(self.heap)[1]
+
+
+class _BucketQueue(Generic[T]):
+    # Dial's queue: one bucket per whole priority, emptied lowest first. Every
+    # push and pop is O(1) on average, but priorities have to be small ints.
+    def __init__(self) -> None:
+        self.buckets: list[list[T]] = []
+        self.lowest = 0
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def push(self, priority: float, item: T) -> None:
+        bucket = int(priority)
+        while bucket >= len(self.buckets):
+            self.buckets.append([])
+        self.buckets[bucket].append(item)
+        self.lowest = min(self.lowest, bucket)
+        self.size += 1
+
+    def pop(self) -> T:
+        while len(self.buckets[self.lowest]) == 0:
+            self.lowest += 1
+        self.size -= 1
+        return self.buckets[self.lowest].pop()
+
+
+@dataclass
+class SearchStats:
+    searches: int = 0
+    expansions: int = 0
+    pushes: int = 0
+    # Entries popped for a node that had already been expanded
+    stale_pops: int = 0
+    peak_frontier: int = 0
+    heuristic_calls: int = 0
+    neighbor_calls: int = 0
+
+    def report(self) -> str:
+        return "\n".join(f"{name:>16}: {value}" for name, value in asdict(self).items())
+
+
+# Where searches add their counts when they aren't handed stats of their own
+_collector: SearchStats | None = None
+
+
+@contextmanager
+def collect_search_stats() -> Iterator[SearchStats]:
+    # Counts for every search run inside the block, added together
+    global _collector
+    previous = _collector
+    _collector = stats = SearchStats()
+    try:
+        yield stats
+    finally:
+        _collector = previous
+
+
+class SearchResult(NamedTuple):
+    # Not generic over the state type, NamedTuple can't be before Python 3.11
+    goal: Any
+    cost: float
+    # Only filled in when asked for
+    path: list[Any] | None = None
+
+
+class _Counter(Generic[T]):
+    # Stands in for a search's frontier and wraps its estimate and neighbour
+    # callbacks, adding to stats as they're used. Only put in when someone's
+    # watching, so other searches don't pay for the counting.
+    def __init__(
+        self,
+        frontier: _HeapQueue[T] | _BucketQueue[T],
+        estimate: Callable[[T], float],
+        next_func: NeighborFunc[T],
+        stats: SearchStats,
+    ) -> None:
+        self.frontier = frontier
+        self._estimate = estimate
+        self._next_func = next_func
+        self.stats = stats
+        self.pops = 0
+        self.expansions = 0
+
+    def __len__(self) -> int:
+        return len(self.frontier)
+
+    def push(self, priority: float, item: T) -> None:
+        self.stats.pushes += 1
+        self.frontier.push(priority, item)
+
+    def pop(self) -> T:
+        self.stats.peak_frontier = max(self.stats.peak_frontier, len(self.frontier))
+        self.pops += 1
+        return self.frontier.pop()
+
+    def estimate(self, current: T) -> float:
+        self.stats.heuristic_calls += 1
+        return self._estimate(current)
+
+    def next_func(self, current: T, paths: dict[T, T]) -> Iterator[T]:
+        # Only ever asked once for each node expanded
+        self.stats.neighbor_calls += 1
+        self.expansions += 1
+        return self._next_func(current, paths)
+
+
+def _search(
+    starts: Iterable[T],
+    is_goal: Callable[[T], bool],
+    estimate: Callable[[T], float],
+    cost_func: CostFunc[T],
+    next_func: NeighborFunc[T],
+    int_costs: bool = False,
+    stats: SearchStats | None = None,
+    reopen: bool = False,
+) -> tuple[dict[T, T], T, float]:
+    frontier: _HeapQueue[T] | _BucketQueue[T]
+    frontier = _BucketQueue() if int_costs else _HeapQueue()
+    if stats is None:
+        stats = _collector
+    if stats is None:
+        return _search_loop(
+            starts, is_goal, estimate, cost_func, next_func, frontier, reopen
+        )
+
+    stats.searches += 1
+    counter = _Counter(frontier, estimate, next_func, stats)
+    try:
+        result = _search_loop(
+            starts,
+            is_goal,
+            counter.estimate,
+            cost_func,
+            counter.next_func,
+            counter,
+            reopen,
+        )
+    except ValueError:
+        stats.stale_pops += counter.pops - counter.expansions
+        stats.expansions += counter.expansions
+        raise
+    # Every pop is an expansion, a stale entry, or the goal
+    stats.stale_pops += counter.pops - counter.expansions - 1
+    stats.expansions += counter.expansions
+    return result
+
+
+def _search_loop(
+    starts: Iterable[T],
+    is_goal: Callable[[T], bool],
+    estimate: Callable[[T], float],
+    cost_func: CostFunc[T],
+    next_func: NeighborFunc[T],
+    frontier: _HeapQueue[T] | _BucketQueue[T] | _Counter[T],
+    reopen: bool,
+) -> tuple[dict[T, T], T, float]:
     paths: dict[T, T] = {}
-    cheapest_path: dict[T, float] = defaultdict(lambda: float("inf"))
-    cheapest_path[start] = 0.0
+    cheapest_path: dict[T, float] = {}
+    for start in starts:
+        frontier.push(estimate(start), start)
+        cheapest_path[start] = 0.0
+    # With a consistent heuristic, and costs that don't depend on the path so
+    # far, a node is never reached cheaper once it has been expanded, so any
+    # later entries for it are stale. Without those, reopen leaves the set
+    # empty and nodes get expanded again whenever they're reached cheaper.
+    closed: set[T] = set()
 
     while len(frontier) > 0:
-        _, current = heapq.heappop(frontier)
-        if current == goal:
-            path = _reconstruct_path(paths, start, goal)
-            return path, cheapest_path[current]
+        current: T = frontier.pop()
+        if current in closed:
+            continue
+        if is_goal(current):
+            return paths, current, cheapest_path[current]
+        if not reopen:
+            closed.add(current)
 
+        current_cost = cheapest_path[current]
         for neighbor in next_func(current, paths):
-            new_cost = cheapest_path[current] + cost_func(paths, neighbor, current)
+            if neighbor in closed:
+                continue
+            new_cost = current_cost + cost_func(paths, neighbor, current)
 
-            if new_cost < cheapest_path[neighbor]:
+            if new_cost < cheapest_path.get(neighbor, math.inf):
                 paths[neighbor] = current
                 cheapest_path[neighbor] = new_cost
-                heapq.heappush(
-                    frontier, (new_cost + heuristic(neighbor, goal), neighbor)
-                )
+                frontier.push(new_cost + estimate(neighbor), neighbor)
 
     raise ValueError("Could not find a path.")
+
+
+def _no_estimate(current: T) -> float:
+    return 0
+
+
+def search(
+    starts: Iterable[T],
+    goals: Container[T] | Callable[[T], bool],
+    cost_func: CostFunc[T],
+    next_func: NeighborFunc[T],
+    estimate: Callable[[T], float] | None = None,
+    int_costs: bool = False,
+    with_path: bool = False,
+    stats: SearchStats | None = None,
+    reopen: bool = False,
+) -> SearchResult:
+    # One search from every start at once, stopping at the first goal settled.
+    # goals is either a collection of end states or a predicate on a state, and
+    # estimate a lower bound on the cost from a state to the nearest goal. With
+    # no estimate this is plain Dijkstra. Expanded states are never expanded
+    # again, which needs a consistent estimate and costs that don't look at
+    # paths. Otherwise pass reopen.
+    starts = list(starts)
+    is_goal = goals if callable(goals) else goals.__contains__
+    if estimate is None:
+        estimate = _no_estimate
+    paths, goal, cost = _search(
+        starts, is_goal, estimate, cost_func, next_func, int_costs, stats, reopen
+    )
+    if not with_path:
+        return SearchResult(goal, cost)
+    return SearchResult(goal, cost, _reconstruct_path(paths, set(starts), goal))
+
+
+def lower_bound_table(
+    cell_costs: Sequence[int], width: int, goals: Iterable[int]
+) -> list[float]:
+    # The cheapest way from every cell to the nearest goal, stepping between
+    # orthogonal neighbours and paying for each cell stepped onto. Cells are
+    # indexed y * width + x. Run backwards from the goals as one Dijkstra, it
+    # ignores whatever rules a real search has about moving, which makes it a
+    # consistent heuristic for any search that pays the same per cell.
+    table = [math.inf] * len(cell_costs)
+    frontier: list[tuple[float, int]] = []
+    for goal in goals:
+        table[goal] = 0
+        frontier.append((0, goal))
+    heapq.heapify(frontier)
+
+    while len(frontier) > 0:
+        cost, current = heapq.heappop(frontier)
+        if cost > table[current]:
+            continue
+        # Stepping from a neighbour onto this cell is what costs
+        new_cost = cost + cell_costs[current]
+        x = current % width
+        for neighbor, in_bounds in (
+            (current - width, current >= width),
+            (current + width, current + width < len(cell_costs)),
+            (current - 1, x > 0),
+            (current + 1, x < width - 1),
+        ):
+            if in_bounds and new_cost < table[neighbor]:
+                table[neighbor] = new_cost
+                heapq.heappush(frontier, (new_cost, neighbor))
+
+    return table
+
+
+def a_star(
+    start: T,
+    goal: T,
+    heuristic: Callable[[T, T], float],
+    cost_func: CostFunc[T],
+    next_func: NeighborFunc[T],
+    stats: SearchStats | None = None,
+) -> tuple[list[T], float]:
+    # Nodes are expanded again whenever they're reached cheaper, so this stays
+    # right for costs that depend on paths and heuristics that aren't
+    # consistent
+    paths, _, cost = _search(
+        [start],
+        lambda current: current == goal,
+        lambda current: heuristic(current, goal),
+        cost_func,
+        next_func,
+        stats=stats,
+        reopen=True,
+    )
+    return _reconstruct_path(paths, [start], goal), cost
+
+
+def a_star_cost(
+    start: T,
+    goal: T,
+    heuristic: Callable[[T, T], float],
+    cost_func: CostFunc[T],
+    next_func: NeighborFunc[T],
+    int_costs: bool = False,
+    stats: SearchStats | None = None,
+) -> float:
+    # Only the cost of the cheapest path. int_costs swaps the heap for a bucket
+    # queue, for costs and heuristics that are small whole numbers.
+    _, _, cost = _search(
+        [start],
+        lambda current: current == goal,
+        lambda current: heuristic(current, goal),
+        cost_func,
+        next_func,
+        int_costs,
+        stats,
+    )
+    return cost
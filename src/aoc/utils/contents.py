@@ -1,16 +1,105 @@
+import mmap
+from collections.abc import Iterator
 from dataclasses import dataclass
+from functools import cached_property
 
 
 @dataclass(frozen=True)
 class PuzzleInput:
-    raw: str
-    lines: list[str]
+    # Either the file contents, or a read-only map of the file. Everything else
+    # is derived from this on first use.
+    data: bytes | mmap.mmap
 
+    @classmethod
+    def from_text(cls, text: str) -> "PuzzleInput":
+        return cls(text.encode())
 
-def get_puzzle_input(filepath: str) -> PuzzleInput:
-    with open(filepath) as file:
-        raw = file.read()
-    with open(filepath) as file:
-        lines = file.readlines()
-        lines = list(map(lambda line: line.strip(), lines))
-    return PuzzleInput(raw=raw, lines=lines)
+    @property
+    def view(self) -> memoryview:
+        return memoryview(self.data)
+
+    @cached_property
+    def raw(self) -> str:
+        return str(self.data, "utf-8")
+
+    @cached_property
+    def lines(self) -> list[str]:
+        # Split the buffer rather than raw, so days that only want the lines
+        # never hold a decoded copy of the whole file as well.
+        return [line.strip().decode() for line in self._raw_lines()]
+
+    def records(self, separator: str = "\n") -> Iterator[str]:
+        if separator == "\n":
+            return iter(self.lines)
+        parts = self.raw.split(separator)
+        if parts[-1] == "":
+            parts.pop()
+        return (part.strip() for part in parts)
+
+    def chunks(self, size: int = 1 << 16) -> Iterator[bytes]:
+        # Pieces of at least size bytes that end on a line break, so whole
+        # lines can be handed out to workers a batch at a time
+        start = 0
+        while start < len(self.data):
+            end = self.data.find(b"\n", start + size - 1)
+            end = len(self.data) if end == -1 else end + 1
+            yield bytes(self.view[start:end])
+            start = end
+
+    def _raw_lines(self) -> Iterator[bytes]:
+        if isinstance(self.data, mmap.mmap):
+            self.data.seek(0)
+            return iter(self.data.readline, b"")
+        return iter(self.data.splitlines())
+
+
+class PuzzleStream:
+    # For days that only look at one line (or record) at a time. Nothing is
+    # kept around, every pass over lines reads the file again in chunks.
+    def __init__(self, filepath: str, chunk_size: int = 1 << 16) -> None:
+        self.filepath = filepath
+        self.chunk_size = chunk_size
+
+    @property
+    def lines(self) -> Iterator[str]:
+        return self.records("\n")
+
+    def records(self, separator: str = "\n") -> Iterator[str]:
+        with open(self.filepath, encoding="utf-8", errors="strict") as file:
+            pending = ""
+            while chunk := file.read(self.chunk_size):
+                # The unfinished record goes round again with the new chunk, as
+                # a separator can start in one chunk and end in the next
+                parts = (pending + chunk).split(separator)
+                pending = parts.pop()
+                for part in parts:
+                    yield part.strip()
+
+            if pending != "":
+                yield pending.strip()
+
+    def chunks(self, size: int | None = None) -> Iterator[bytes]:
+        # As PuzzleInput.chunks, reading the file as it goes
+        size = self.chunk_size if size is None else size
+        with open(self.filepath, "rb") as file:
+            pending = b""
+            while chunk := file.read(size):
+                end = chunk.rfind(b"\n")
+                if end == -1:
+                    pending += chunk
+                    continue
+                yield pending + chunk[: end + 1]
+                pending = chunk[end + 1 :]
+            if pending != b"":
+                yield pending
+
+
+def get_puzzle_input(filepath: str, use_mmap: bool = False) -> PuzzleInput:
+    with open(filepath, "rb") as file:
+        if not use_mmap:
+            return PuzzleInput(file.read())
+        try:
+            return PuzzleInput(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+        except ValueError:
+            # Empty files can't be mapped
+            return PuzzleInput(b"")
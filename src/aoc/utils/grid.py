@@ -0,0 +1,116 @@
+from collections.abc import Iterable, Iterator
+
+from aoc.utils.common import Coord, Direction
+
+
+class Grid:
+    # All the cells in one flat bytearray, addressed by their index in it. A
+    # neighbour is always the same offset away, and padding puts a border of
+    # sentinel cells round the outside so walks can stop on those instead of
+    # checking bounds. Transposing only swaps the row and column steps, the
+    # cells are shared.
+    def __init__(
+        self,
+        cells: bytearray,
+        width: int,
+        height: int,
+        padding: int = 0,
+        origin: int | None = None,
+        row_step: int | None = None,
+        col_step: int = 1,
+    ) -> None:
+        self.cells = cells
+        self.width = width
+        self.height = height
+        self.padding = padding
+        self.row_step = width + 2 * padding if row_step is None else row_step
+        self.col_step = col_step
+        if origin is None:
+            origin = padding * (self.row_step + self.col_step)
+        self.origin = origin
+
+        up, right = -self.row_step, self.col_step
+        # North, east, south, west
+        self.orthogonal = (up, right, -up, -right)
+        self.adjacent = (
+            *self.orthogonal,
+            up + right,
+            up - right,
+            -up + right,
+            -up - right,
+        )
+
+    @classmethod
+    def from_lines(
+        cls, lines: Iterable[str], padding: int = 0, sentinel: str = "#"
+    ) -> "Grid":
+        rows = [line.encode() for line in lines if line != ""]
+        width = len(rows[0]) if len(rows) > 0 else 0
+        border = sentinel.encode() * padding
+        cells = bytearray()
+        cells.extend(border * (width + 2 * padding))
+        for row in rows:
+            cells.extend(border + row + border)
+        cells.extend(border * (width + 2 * padding))
+        return cls(cells, width, len(rows), padding)
+
+    def index(self, x: int, y: int) -> int:
+        return self.origin + y * self.row_step + x * self.col_step
+
+    def coord(self, index: int) -> Coord:
+        if self.col_step == 1:
+            y, x = divmod(index - self.origin, self.row_step)
+        else:
+            x, y = divmod(index - self.origin, self.col_step)
+        return Coord(x, y)
+
+    def offset(self, direction: Direction) -> int:
+        return direction.value.y * self.row_step + direction.value.x * self.col_step
+
+    def __getitem__(self, index: int) -> int:
+        return self.cells[index]
+
+    def __setitem__(self, index: int, value: int) -> None:
+        self.cells[index] = value
+
+    def get(self, x: int, y: int) -> str:
+        return chr(self.cells[self.index(x, y)])
+
+    def indices(self) -> Iterator[int]:
+        for y in range(self.height):
+            start = self.index(0, y)
+            yield from range(start, start + self.width * self.col_step, self.col_step)
+
+    def row(self, y: int) -> memoryview:
+        start = self.index(0, y)
+        stop = start + self.width * self.col_step
+        return memoryview(self.cells)[start : stop : self.col_step]
+
+    def column(self, x: int) -> memoryview:
+        start = self.index(x, 0)
+        stop = start + self.height * self.row_step
+        return memoryview(self.cells)[start : stop : self.row_step]
+
+    def rows(self) -> Iterator[memoryview]:
+        return (self.row(y) for y in range(self.height))
+
+    def transpose(self) -> "Grid":
+        return Grid(
+            self.cells,
+            self.height,
+            self.width,
+            self.padding,
+            self.origin,
+            self.col_step,
+            self.row_step,
+        )
+
+    def find(self, char: str) -> int:
+        value = ord(char)
+        for y, row in enumerate(self.rows()):
+            if value in row:
+                return self.index(row.tolist().index(value), y)
+        raise ValueError(f"{char!r} not in grid")
+
+    def lines(self) -> list[str]:
+        return [row.tobytes().decode() for row in self.rows()]
@@ -0,0 +1,103 @@
+import functools
+import itertools
+import multiprocessing
+import operator
+import os
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from timeit import default_timer as timer
+from typing import TypeVar
+
+R = TypeVar("R")
+T = TypeVar("T")
+
+# Records solved in this process up front, to time how long one takes
+PROBE_RECORDS = 32
+# Less work than this left after the probe isn't worth starting workers for
+MIN_PARALLEL_TIME = 0.25
+# How long each chunk should take. Long enough that pickling it over to a
+# worker, and the answer back, gets lost in the noise.
+CHUNK_TIME = 0.05
+
+
+def _reduce_chunk(
+    func: Callable[[R], T], reduce: Callable[[T, T], T], initial: T, chunk: list[R]
+) -> T:
+    return functools.reduce(reduce, map(func, chunk), initial)
+
+
+def _chunked(records: Iterator[R], size: int) -> Iterator[list[R]]:
+    while len(chunk := list(itertools.islice(records, size))) > 0:
+        yield chunk
+
+
+def _in_flight(
+    executor: Executor, func: Callable[[R], T], items: Iterator[R], limit: int
+) -> Iterator[T]:
+    # func over every item on the executor, in whatever order they finish. No
+    # more than limit items are handed over at a time, and the next is only
+    # taken once there's room, so items can be a stream.
+    pending: set[Future[T]] = set()
+    while True:
+        for item in itertools.islice(items, limit - len(pending)):
+            pending.add(executor.submit(func, item))
+        if len(pending) == 0:
+            return
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield future.result()
+
+
+def map_reduce(
+    func: Callable[[R], T],
+    records: Iterable[R],
+    reduce: Callable[[T, T], T] = operator.add,
+    initial: T = 0,  # type: ignore[assignment]
+    workers: int | None = None,
+) -> T:
+    # reduce over func(record) for every record, spread over a pool of worker
+    # processes when there's enough work. Chunks are reduced on their own and
+    # then together in whatever order they finish, so reduce can't care about
+    # order and initial has to leave anything it's reduced with as it was: 0
+    # for a sum, 1 for a product, math.inf for a min. func and reduce go to
+    # the workers, so they have to be picklable, i.e. module level. Records
+    # are only read as they're needed, never all at once.
+    records = iter(records)
+    workers = os.cpu_count() if workers is None else workers
+
+    start = timer()
+    probe = list(itertools.islice(records, PROBE_RECORDS))
+    result = _reduce_chunk(func, reduce, initial, probe)
+    if len(probe) < PROBE_RECORDS:
+        return result
+    per_record = max((timer() - start) / len(probe), 1e-9)
+
+    # Workers of the runner's own pool don't get a pool of their own
+    workers = workers or 1
+    if workers < 2 or multiprocessing.parent_process() is not None:
+        return functools.reduce(reduce, map(func, records), result)
+
+    # Carry on here until there's been enough work to be worth starting a pool
+    enough = int(MIN_PARALLEL_TIME / per_record)
+    result = functools.reduce(
+        reduce, map(func, itertools.islice(records, enough)), result
+    )
+    try:
+        first = next(records)
+    except StopIteration:
+        return result
+
+    size = max(1, int(CHUNK_TIME / per_record))
+    chunks = _chunked(itertools.chain([first], records), size)
+    reduce_chunk = functools.partial(_reduce_chunk, func, reduce, initial)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # A couple of chunks each, so no worker waits on the next
+        for chunk_result in _in_flight(executor, reduce_chunk, chunks, 2 * workers):
+            result = reduce(result, chunk_result)
+    return result
@@ -0,0 +1,69 @@
+import re
+from array import array
+from typing import Any, AnyStr
+
+INT = re.compile(r"-?\d+")
+INT_BYTES = re.compile(rb"-?\d+")
+# Every byte that can't be part of a number mapped to a space
+NUMERIC = bytes(c if c in b"-0123456789" else ord(" ") for c in range(256))
+# The parts of a parse style format string that capture something
+FIELD = re.compile(r"\{(:d)?\}")
+
+
+def ints(text: str | bytes) -> list[int]:
+    # Every whole number in the text, minus signs included
+    if isinstance(text, bytes):
+        return list(map(int, INT_BYTES.findall(text)))
+    return list(map(int, INT.findall(text)))
+
+
+def int_array(data: str | bytes | memoryview) -> "array[int]":
+    # The same numbers as ints(), packed into 64 bit machine ints rather than a
+    # list of int objects. Hand it the puzzle's view to skip decoding the input
+    # at all. Blanking out everything but digits and minus signs and splitting
+    # on the gaps is a lot quicker than the regex, and it only goes wrong on a
+    # minus sign that isn't part of a number, like the dash in "seed-to-soil".
+    buffer = data.encode() if isinstance(data, str) else bytes(data)
+    try:
+        return array("q", list(map(int, buffer.translate(NUMERIC).split())))
+    except ValueError:
+        return array("q", list(map(int, INT_BYTES.findall(buffer))))
+
+
+class Format:
+    # A format string in the style of the parse library, compiled to a regex
+    # once rather than on every call. "{}" captures text and "{:d}" captures a
+    # whole number, which comes back as an int. Matches come back as a tuple of
+    # the captures, or None.
+    def __init__(self, fmt: str) -> None:
+        regex = []
+        self.converters: list[type] = []
+        last = 0
+        for field in FIELD.finditer(fmt):
+            regex.append(re.escape(fmt[last : field.start()]))
+            if field.group(1) is None:
+                regex.append("(.+?)")
+                self.converters.append(str)
+            else:
+                regex.append(r"(-?\d+)")
+                self.converters.append(int)
+            last = field.end()
+        regex.append(re.escape(fmt[last:]))
+        self.regex = re.compile("".join(regex))
+        self.converters_needed = int in self.converters
+
+    def _convert(self, match: re.Match[AnyStr] | None) -> tuple[Any, ...] | None:
+        if match is None:
+            return None
+        if not self.converters_needed:
+            return match.groups()
+        return tuple(
+            convert(value) for convert, value in zip(self.converters, match.groups())
+        )
+
+    def parse(self, text: str) -> tuple[Any, ...] | None:
+        # The whole of the text has to match
+        return self._convert(self.regex.fullmatch(text))
+
+    def search(self, text: str) -> tuple[Any, ...] | None:
+        return self._convert(self.regex.search(text))
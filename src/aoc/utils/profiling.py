@@ -0,0 +1,194 @@
+import cProfile
+import pstats
+import signal
+import sys
+import threading
+import tracemalloc
+from collections import Counter
+from collections.abc import Callable
+from pathlib import Path
+from types import FrameType
+from typing import Any
+
+from aoc.utils.common import collect_search_stats
+
+
+def _frame_label(frame: FrameType) -> str:
+    module = frame.f_globals.get("__name__", "?")
+    return f"{module}:{frame.f_code.co_name}"
+
+
+class StackSampler:
+    # A tiny sampling profiler for flamegraphs. cProfile only knows about
+    # caller/callee pairs, so it can't give us whole stacks.
+    def __init__(self, interval: float = 0.001) -> None:
+        self.interval = interval
+        self.samples: Counter[str] = Counter()
+        self._root: FrameType | None = None
+
+    def _sample(self, signum: int, frame: FrameType | None) -> None:
+        stack = []
+        while frame is not None and frame is not self._root:
+            stack.append(_frame_label(frame))
+            frame = frame.f_back
+        if len(stack) > 0:
+            self.samples[";".join(reversed(stack))] += 1
+
+    def run(self, func: Callable[[Any], Any], arg: Any) -> Any:
+        # Stacks are cut off here, so they start at the code being profiled
+        self._root = sys._getframe()
+        previous = signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        try:
+            return func(arg)
+        finally:
+            signal.setitimer(signal.ITIMER_PROF, 0, 0)
+            signal.signal(signal.SIGPROF, previous)
+
+    def write(self, path: Path) -> None:
+        with open(path, "w") as file:
+            for stack, count in sorted(self.samples.items()):
+                file.write(f"{stack} {count}\n")
+
+
+def _function_label(function: tuple[str, int, str]) -> str:
+    filename, line, name = function
+    if filename == "~":
+        # Builtins
+        return name
+    return f"{Path(filename).name}:{line}({name})"
+
+
+def print_hot_paths(stats: pstats.Stats, top: int) -> None:
+    entries = stats.stats.items()  # type: ignore[attr-defined]
+    for title, index in (("cumulative", 3), ("self", 2)):
+        print(f"Top {top} by {title} time:")
+        print(f"{'cumtime':>10} {'tottime':>10} {'calls':>10}  function")
+        ordered = sorted(entries, key=lambda entry: entry[1][index], reverse=True)
+        for function, (_, calls, tottime, cumtime, _) in ordered[:top]:
+            print(
+                f"{cumtime:>10.3f} {tottime:>10.3f} {calls:>10}"
+                f"  {_function_label(function)}"
+            )
+        print()
+
+
+class Profiler:
+    # Hooks into the runner and profiles every phase of a day it's handed
+    def __init__(
+        self,
+        day: str,
+        output_dir: Path,
+        top: int = 15,
+        collapsed: bool = False,
+    ) -> None:
+        self.day = day
+        self.output_dir = output_dir
+        self.top = top
+        self.collapsed = collapsed
+
+    def __call__(self, phase: str, func: Callable[[Any], Any], arg: Any) -> Any:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        profile = cProfile.Profile()
+        sampler = StackSampler() if self.collapsed else None
+
+        with collect_search_stats() as search_stats:
+            profile.enable()
+            try:
+                if sampler is None:
+                    result = func(arg)
+                else:
+                    result = sampler.run(func, arg)
+            finally:
+                profile.disable()
+
+        stats_path = self.output_dir / f"{self.day}_{phase}.pstats"
+        profile.dump_stats(stats_path)
+        print(f"== {self.day} {phase}: profile written to {stats_path}")
+        if sampler is not None:
+            collapsed_path = self.output_dir / f"{self.day}_{phase}.collapsed"
+            sampler.write(collapsed_path)
+            print(f"== {self.day} {phase}: stacks written to {collapsed_path}")
+        print()
+        print_hot_paths(pstats.Stats(profile), self.top)
+        if search_stats.searches > 0:
+            print("Search counters:")
+            print(search_stats.report())
+            print()
+        return result
+
+
+class _PeakWatcher(threading.Thread):
+    # tracemalloc only knows the size of the peak, not what was allocated at
+    # the time. So keep an eye on it and snapshot whenever it grows a lot.
+    def __init__(self, interval: float = 0.05, growth: float = 1.1) -> None:
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.growth = growth
+        self.snapshot: tracemalloc.Snapshot | None = None
+        self.snapshot_size = 0
+        self.done = threading.Event()
+
+    def run(self) -> None:
+        while not self.done.wait(self.interval):
+            current, _ = tracemalloc.get_traced_memory()
+            if current > self.snapshot_size * self.growth:
+                self.snapshot = tracemalloc.take_snapshot()
+                self.snapshot_size = current
+
+
+def _format_size(size: float) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+class MemoryTracer:
+    # Hooks into the runner and reports the peak traced allocation per phase
+    def __init__(self, day: str, top: int = 10, verbose: bool = True) -> None:
+        self.day = day
+        self.top = top
+        self.verbose = verbose
+        self.peaks: dict[str, int] = {}
+
+    def __call__(self, phase: str, func: Callable[[Any], Any], arg: Any) -> Any:
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        tracemalloc.start()
+        watcher = _PeakWatcher()
+        watcher.start()
+        try:
+            result = func(arg)
+        finally:
+            watcher.done.set()
+            watcher.join()
+            _, peak = tracemalloc.get_traced_memory()
+            snapshot = watcher.snapshot
+            if snapshot is None or watcher.snapshot_size == 0:
+                snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+
+        self.peaks[phase] = peak
+        if self.verbose:
+            self.report(phase, peak, snapshot)
+        return result
+
+    def report(self, phase: str, peak: int, snapshot: tracemalloc.Snapshot) -> None:
+        print(f"== {self.day} {phase}: peak traced memory {_format_size(peak)}")
+        snapshot = snapshot.filter_traces(
+            (
+                tracemalloc.Filter(False, __file__),
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, threading.__file__),
+            )
+        )
+        print(f"Top {self.top} allocation sites near the peak:")
+        for stat in snapshot.statistics("lineno")[: self.top]:
+            frame = stat.traceback[0]
+            print(
+                f"{_format_size(stat.size):>12} {stat.count:>10}"
+                f"  {Path(frame.filename).name}:{frame.lineno}"
+            )
+        print()
@@ -0,0 +1,39 @@
+import importlib
+import pkgutil
+import re
+from types import ModuleType
+
+import aoc
+
+DAY_PATTERN = re.compile(r"day_(\d+)")
+
+
+def day_number(day: str) -> int:
+    match = DAY_PATTERN.fullmatch(day)
+    if match is None:
+        raise ValueError(f"Not a day: {day}")
+    return int(match.group(1))
+
+
+def normalize_day(day: str) -> str:
+    # Accept both "5" and "day_5"
+    if day.isdigit():
+        return f"day_{int(day)}"
+    return day
+
+
+def available_days() -> list[str]:
+    # Only looks at the module names, nothing gets imported here.
+    days = [
+        module.name
+        for module in pkgutil.iter_modules(aoc.__path__)
+        if DAY_PATTERN.fullmatch(module.name)
+    ]
+    return sorted(days, key=day_number)
+
+
+def load_day(day: str) -> ModuleType:
+    day = normalize_day(day)
+    if day not in available_days():
+        raise ValueError("Unknown day!")
+    return importlib.import_module(f"{aoc.__name__}.{day}")
@@ -0,0 +1,229 @@
+import json
+import os
+import traceback
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from importlib.resources import files
+from pathlib import Path
+from timeit import default_timer as timer
+from types import ModuleType
+from typing import Any, cast
+
+from aoc.utils import contents, registry
+from aoc.utils.cache import ResultCache
+
+
+@dataclass
+class DayResult:
+    day: str
+    part_1: Any = None
+    part_2: Any = None
+    import_time: float = 0.0
+    parse_time: float = 0.0
+    part_1_time: float = 0.0
+    part_2_time: float = 0.0
+    cached: bool = False
+    error: str | None = None
+
+    @property
+    def total_time(self) -> float:
+        return self.import_time + self.parse_time + self.part_1_time + self.part_2_time
+
+
+def cache_dir() -> Path:
+    if "AOC_CACHE_DIR" in os.environ:
+        return Path(os.environ["AOC_CACHE_DIR"])
+    return Path.home() / ".cache" / "aoc"
+
+
+def timings_path(test: bool) -> Path:
+    return cache_dir() / ("timings_test.json" if test else "timings.json")
+
+
+def input_path(day: str, test: bool) -> str:
+    filename = "test.txt" if test else "input.txt"
+    return str(files("aoc.inputs") / day / filename)
+
+
+def load_puzzle(
+    module: ModuleType, path: str, use_mmap: bool = False, stream: bool = False
+) -> contents.PuzzleInput | contents.PuzzleStream:
+    # Days that only ever walk the input line by line say so with STREAMING,
+    # and never get the whole file in memory.
+    if getattr(module, "STREAMING", False) or streamed(module, stream):
+        return contents.PuzzleStream(path)
+    return contents.get_puzzle_input(path, use_mmap)
+
+
+def streamed(module: ModuleType, stream: bool) -> bool:
+    # Days that need the whole input by default can have a streaming mode as
+    # well, streamed_part_1 and streamed_part_2, used when asked for
+    return stream and hasattr(module, "streamed_part_1")
+
+
+def prepare(
+    module: ModuleType,
+    puzzle: contents.PuzzleInput | contents.PuzzleStream,
+    stream: bool = False,
+) -> Any:
+    # Days can parse (and precompute) once in prepare(), and both parts are then
+    # handed its result. Days without one just get the puzzle, as do streamed
+    # parts.
+    if has_prepare(module, stream):
+        return module.prepare(puzzle)
+    return puzzle
+
+
+def has_prepare(module: ModuleType, stream: bool = False) -> bool:
+    return hasattr(module, "prepare") and not streamed(module, stream)
+
+
+def parts(
+    module: ModuleType, stream: bool = False
+) -> tuple[Callable[[Any], Any], Callable[[Any], Any]]:
+    if streamed(module, stream):
+        return module.streamed_part_1, module.streamed_part_2
+    return module.part_1, module.part_2
+
+
+# Called as hook(phase, func, arg) for each phase of a day, so callers can wrap
+# the work in a profiler and the like.
+PhaseHook = Callable[[str, Callable[[Any], Any], Any], Any]
+
+
+def _call(phase: str, func: Callable[[Any], Any], arg: Any) -> Any:
+    return func(arg)
+
+
+def default_cache() -> ResultCache:
+    return ResultCache(cache_dir() / "results.json")
+
+
+def run_day(
+    day: str,
+    test: bool = False,
+    use_mmap: bool = False,
+    cache: ResultCache | None = None,
+    stream: bool = False,
+) -> DayResult:
+    day = registry.normalize_day(day)
+    if cache is None:
+        return solve_day(day, test, use_mmap, stream=stream)
+
+    key = cache.key(day, input_path(day, test))
+    answers = cache.get(key)
+    if answers is not None:
+        return DayResult(day, *answers, cached=True)
+
+    result = solve_day(day, test, use_mmap, stream=stream)
+    cache.put(key, result.part_1, result.part_2)
+    return result
+
+
+def solve_day(
+    day: str,
+    test: bool = False,
+    use_mmap: bool = False,
+    hook: PhaseHook = _call,
+    stream: bool = False,
+) -> DayResult:
+    result = DayResult(day)
+
+    # Only import the solver that was asked for
+    import_start = timer()
+    module = registry.load_day(day)
+    result.import_time = timer() - import_start
+
+    puzzle = load_puzzle(module, input_path(day, test), use_mmap, stream)
+    parse_start = timer()
+    state = puzzle
+    part_1, part_2 = parts(module, stream)
+    if has_prepare(module, stream):
+        state = hook("parse", module.prepare, puzzle)
+    start_time = timer()
+    result.part_1 = hook("part_1", part_1, state)
+    middle_time = timer()
+    result.part_2 = hook("part_2", part_2, state)
+    end_time = timer()
+
+    result.parse_time = start_time - parse_start
+    result.part_1_time = middle_time - start_time
+    result.part_2_time = end_time - middle_time
+    return result
+
+
+def _run_day_safely(day: str, test: bool, use_mmap: bool, stream: bool) -> DayResult:
+    # A broken day shouldn't take the rest of the report down with it
+    try:
+        return solve_day(day, test, use_mmap, stream=stream)
+    except BaseException:
+        return DayResult(day, error=traceback.format_exc())
+
+
+def load_timings(test: bool) -> dict[str, float]:
+    try:
+        with open(timings_path(test)) as file:
+            return cast(dict[str, float], json.load(file))
+    except (OSError, ValueError):
+        return {}
+
+
+def save_timings(results: list[DayResult], test: bool) -> None:
+    timings = load_timings(test)
+    for result in results:
+        if result.error is None and not result.cached:
+            timings[result.day] = result.total_time
+
+    path = timings_path(test)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as file:
+        json.dump(timings, file, indent=2, sort_keys=True)
+
+
+def schedule(days: list[str], timings: dict[str, float]) -> list[str]:
+    # Longest first, so the slow days start straight away and the cheap ones
+    # fill in around them. Days we've never timed go first, they might be slow.
+    return sorted(days, key=lambda day: timings.get(day, float("inf")), reverse=True)
+
+
+def run_days(
+    days: list[str],
+    test: bool = False,
+    workers: int | None = None,
+    use_mmap: bool = False,
+    cache: ResultCache | None = None,
+    stream: bool = False,
+) -> list[DayResult]:
+    days = [registry.normalize_day(day) for day in days]
+
+    # Answer whatever we can from the cache before starting any workers
+    results: dict[str, DayResult] = {}
+    keys: dict[str, str] = {}
+    if cache is not None:
+        for day in days:
+            keys[day] = cache.key(day, input_path(day, test))
+            answers = cache.get(keys[day])
+            if answers is not None:
+                results[day] = DayResult(day, *answers, cached=True)
+
+    order = schedule([d for d in days if d not in results], load_timings(test))
+    if len(order) > 0:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_run_day_safely, day, test, use_mmap, stream)
+                for day in order
+            ]
+            for future in as_completed(futures):
+                result = future.result()
+                results[result.day] = result
+                if cache is not None and result.error is None:
+                    cache.put(keys[result.day], result.part_1, result.part_2)
+
+    ordered = [results[day] for day in days]
+    save_timings(ordered, test)
+    return ordered
+
+
+def to_json(results: list[DayResult]) -> list[dict[str, Any]]:
+    return [asdict(result) for result in results]
@@ -0,0 +1,100 @@
+import math
+
+import pytest
+
+from aoc import gen
+from aoc.utils import bench, registry, runner
+from aoc.utils.contents import PuzzleInput
+
+# How far past its declared exponent a phase may scale before it fails. Leaves
+# room for log factors, and for caches getting colder as the inputs grow.
+TOLERANCE = 0.6
+# Phases quicker than this at the largest size are mostly noise
+MIN_TIME = 0.002
+REPEAT = 3
+
+# Per day, the sizes to run (see gen.SIZES for what they count) and the exponent
+# each phase is allowed: 1 is linear in the size, 2 quadratic and so on. Phases
+# left out have no power law to check:
+# - day_6 part 2, day_20 part 2 and day_23 grow exponentially with the size
+# - day_14 part 2 and day_21 part 2 lean on properties of the real input
+# - day_16 part 2 jumps once the beams start getting caught in the same loops
+# - day_19 part 2 needs pudb
+COMPLEXITY: dict[str, tuple[tuple[int, ...], dict[str, float]]] = {
+    "day_1": ((1000, 2000, 4000, 8000), {"part_1": 1, "part_2": 1}),
+    "day_2": ((250, 500, 1000, 2000), {"part_1": 1, "part_2": 1}),
+    "day_3": ((40, 80, 160, 320), {"part_1": 2, "part_2": 2}),
+    "day_4": ((1000, 2000, 4000, 8000), {"part_1": 1, "part_2": 1}),
+    "day_5": ((20, 40, 80, 160), {"part_1": 1, "part_2": 2}),
+    "day_6": ((64, 128, 256, 512), {"part_1": 1}),
+    "day_7": ((500, 1000, 2000, 4000), {"part_1": 1, "part_2": 1}),
+    "day_8": ((2000, 4000, 8000, 16000), {"parse": 1, "part_1": 1, "part_2": 1}),
+    "day_9": ((400, 800, 1600, 3200), {"part_1": 1, "part_2": 1}),
+    "day_10": ((40, 80, 160, 320), {"parse": 2, "part_1": 2, "part_2": 2}),
+    "day_11": ((500, 1000, 2000, 4000), {"parse": 1, "part_1": 1, "part_2": 1}),
+    "day_12": ((200, 400, 800, 1600), {"part_1": 1, "part_2": 1}),
+    "day_13": ((200, 400, 800, 1600), {"parse": 1, "part_1": 1, "part_2": 1}),
+    "day_14": ((25, 50, 100, 200), {"part_1": 2}),
+    "day_15": ((2000, 4000, 8000, 16000), {"part_1": 1, "part_2": 1}),
+    "day_16": ((20, 40, 80, 160), {"parse": 2, "part_1": 2}),
+    "day_17": ((16, 32, 64, 128), {"parse": 2, "part_1": 2, "part_2": 2}),
+    "day_18": ((100, 200, 400, 800), {"part_1": 1, "part_2": 1}),
+    "day_19": ((200, 400, 800, 1600), {"part_1": 1}),
+    "day_20": ((8, 16, 32, 64), {"part_1": 1}),
+    "day_21": ((32, 64, 128, 256), {"part_1": 1}),
+    "day_22": ((200, 400, 800, 1600), {"parse": 1, "part_1": 1, "part_2": 2}),
+    "day_24": ((50, 100, 200, 400), {"parse": 1, "part_1": 2, "part_2": 1}),
+    "day_25": ((100, 200, 400), {"part_1": 1, "part_2": 1}),
+}
+
+CASES = [(day, phase) for day, (_, phases) in COMPLEXITY.items() for phase in phases]
+
+
+def fit_exponent(sizes: list[int], times: list[float]) -> float:
+    # Least squares slope of log(time) against log(size)
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(time) for time in times]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    return covariance / sum((x - mean_x) ** 2 for x in xs)
+
+
+def time_phase(day: str, phase: str, size: int) -> float:
+    module = registry.load_day(day)
+    text = gen.generate(day, size)
+    best = math.inf
+    for _ in range(REPEAT):
+        bench.clear_caches(module)
+        puzzle = PuzzleInput.from_text(text)
+        if phase == "parse":
+            best = min(best, bench.time_call(module.prepare, puzzle))
+        else:
+            state = runner.prepare(module, puzzle)
+            best = min(best, bench.time_call(getattr(module, phase), state))
+    return best
+
+
+def test_fit_exponent() -> None:
+    assert fit_exponent([1, 2, 4, 8], [3, 12, 48, 192]) == pytest.approx(2)
+    assert fit_exponent([10, 20, 40], [0.5, 0.5, 0.5]) == pytest.approx(0)
+
+
+def test_every_day_declared() -> None:
+    declared = set(COMPLEXITY) | {"day_23"}
+    assert declared == set(registry.available_days())
+
+
+@pytest.mark.complexity
+@pytest.mark.parametrize(("day", "phase"), CASES)
+def test_complexity(day: str, phase: str) -> None:
+    sizes, allowed = COMPLEXITY[day]
+    times = [time_phase(day, phase, size) for size in sizes]
+    if max(times) < MIN_TIME:
+        pytest.skip(f"{day} {phase} is too quick to measure")
+
+    exponent = fit_exponent(list(sizes), times)
+    assert exponent <= allowed[phase] + TOLERANCE, (
+        f"{day} {phase} scales as size^{exponent:.2f},"
+        f" declared size^{allowed[phase]} ({gen.SIZES[day]})"
+    )
@@ -0,0 +1,12 @@
+import pytest
+
+from aoc import day_1
+
+
+def test_chunk_calibration() -> None:
+    assert (
+        day_1.chunk_calibration(b"1abc2\npqr3stu8vwx\n\na1b2c3d4e5f\n") == 12 + 38 + 15
+    )
+    assert day_1.chunk_calibration(b"a1 b2\n") == 12
+    with pytest.raises(ValueError):
+        day_1.chunk_calibration(b"12\nabc\n")
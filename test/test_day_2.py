@@ -0,0 +1,33 @@
+import random
+
+from aoc import day_2, gen
+from aoc.day_2 import BAG, GameIndex, Pull
+
+
+def test_game_index() -> None:
+    puzzle = gen.generate_puzzle("day_2", 300, seed=2)
+    index = day_2.index_games(puzzle.lines)
+    assert len(index) == 300
+    assert index.possible_sum(BAG) == day_2.part_1(puzzle)
+
+    maxima = [
+        (game.id, day_2.max_pull(game)) for game in map(day_2.parse_game, puzzle.lines)
+    ]
+    rng = random.Random(0)
+    bags = [Pull(*(rng.randint(0, 25) for _ in range(3))) for _ in range(200)]
+    expected = [
+        sum(
+            game_id
+            for game_id, most in maxima
+            if all(count <= limit for count, limit in zip(most, bag))
+        )
+        for bag in bags
+    ]
+    assert index.possible_sums(bags) == expected
+
+
+def test_empty_game_index() -> None:
+    index = GameIndex([])
+    assert len(index) == 0
+    assert index.possible_sum(BAG) == 0
+    assert index.possible_sums([BAG, Pull(0, 0, 0)]) == [0, 0]
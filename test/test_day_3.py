@@ -0,0 +1,65 @@
+from pathlib import Path
+
+import pytest
+
+from aoc import day_3, gen
+from aoc.utils import runner
+from aoc.utils.contents import PuzzleInput, PuzzleStream, get_puzzle_input
+
+# 12 and 34 only touch each other, and 6 sits between two stars
+SCHEMATIC = """\
+12.....
+34.....
+.......
+5*6*7..
+"""
+
+# Both stars get one number from the row above and one from the row below
+SHARED_STARS = """\
+.7...3.
+..*..*.
+...8.4.
+.......
+"""
+
+
+def test_symbol_rules() -> None:
+    schematic = day_3.prepare(PuzzleInput.from_text(SCHEMATIC))
+    # A digit isn't a symbol
+    assert day_3.part_1(schematic) == 5 + 6 + 7
+    # 6 counts towards both of its gears
+    assert day_3.part_2(schematic) == 5 * 6 + 6 * 7
+
+
+@pytest.mark.parametrize(
+    "puzzle",
+    [
+        PuzzleInput.from_text(SCHEMATIC),
+        PuzzleInput.from_text(SHARED_STARS),
+        get_puzzle_input(runner.input_path("day_3", test=True)),
+        gen.generate_puzzle("day_3", 60, seed=1),
+    ],
+)
+def test_streamed_parts(puzzle: PuzzleInput) -> None:
+    schematic = day_3.prepare(puzzle)
+    assert day_3.streamed_part_1(puzzle) == day_3.part_1(schematic)
+    assert day_3.streamed_part_2(puzzle) == day_3.part_2(schematic)
+
+
+def test_scan_shared_stars(tmp_path: Path) -> None:
+    path = tmp_path / "input.txt"
+    path.write_text(SHARED_STARS)
+    stream = PuzzleStream(str(path), chunk_size=4)
+
+    parts = list(day_3.scan(stream.lines))
+    assert [part.value for part in parts] == [7, 3, 8, 4]
+    assert parts[0].stars == parts[2].stars == ((2, 1),)
+    assert sorted(day_3.gear_ratios(parts)) == [3 * 4, 7 * 8]
+
+
+def test_streamed_run(monkeypatch: pytest.MonkeyPatch) -> None:
+    # The streaming mode never builds the whole grid
+    monkeypatch.delattr(day_3, "prepare")
+    monkeypatch.delattr(day_3, "part_1")
+    result = runner.run_day("day_3", test=True, stream=True)
+    assert (result.part_1, result.part_2) == (4361, 467835)
@@ -0,0 +1,31 @@
+import math
+import random
+
+from aoc import gen
+from aoc.utils import registry, runner
+
+
+def test_every_day_has_a_generator() -> None:
+    assert sorted(gen.GENERATORS, key=registry.day_number) == registry.available_days()
+
+
+def test_generate_is_seeded() -> None:
+    assert gen.generate("day_17", 20, seed=3) == gen.generate("17", 20, seed=3)
+    assert gen.generate("day_17", 20, seed=3) != gen.generate("day_17", 20, seed=4)
+    assert len(gen.generate_puzzle("day_17", 20).lines) == 20
+
+
+def test_generated_day_4() -> None:
+    module = registry.load_day("day_4")
+    puzzle = gen.generate_puzzle("day_4", 50)
+    assert len(puzzle.lines) == 50
+    # Every card is worth at least itself
+    assert module.part_2(puzzle) >= 50
+
+
+def test_generated_day_20() -> None:
+    module = registry.load_day("day_20")
+    state = runner.prepare(module, gen.generate_puzzle("day_20", 6, seed=1))
+    rng = random.Random(1)
+    targets = rng.sample(range(2**5 + 1, 2**6, 2), 4)
+    assert module.part_2(state) == math.lcm(*targets)
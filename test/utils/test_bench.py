@@ -0,0 +1,32 @@
+from aoc.utils import bench
+
+
+def test_summarize() -> None:
+    stats = bench.summarize([5.0, 1.0, 3.0, 2.0, 4.0])
+    assert stats["min"] == 1.0
+    assert stats["median"] == 3.0
+    assert stats["p95"] == 5.0
+
+
+def test_compare_flags_regressions() -> None:
+    baseline = {
+        "days": {"day_1": {"part_1": {"median": 1.0}, "part_2": {"median": 1.0}}}
+    }
+    results = {
+        "days": {"day_1": {"part_1": {"median": 1.05}, "part_2": {"median": 2.0}}}
+    }
+    regressions = bench.compare(results, baseline, threshold=0.1)
+    assert regressions == [("day_1", "part_2", "median", 2.0)]
+
+
+def test_compare_ignores_quick_parts() -> None:
+    baseline = {"days": {"day_1": {"part_1": {"median": 0.0001}}}}
+    results = {"days": {"day_1": {"part_1": {"median": 0.0005}}}}
+    assert bench.compare(results, baseline, threshold=0.1) == []
+
+
+def test_compare_flags_memory_growth() -> None:
+    baseline = {"days": {"day_1": {"part_1": {"median": 1.0, "peak_bytes": 100}}}}
+    results = {"days": {"day_1": {"part_1": {"median": 1.0, "peak_bytes": 300}}}}
+    regressions = bench.compare(results, baseline, threshold=0.1)
+    assert regressions == [("day_1", "part_1", "peak_bytes", 3.0)]
@@ -0,0 +1,37 @@
+from pathlib import Path
+
+from aoc.utils.cache import ResultCache
+
+
+def test_result_cache_lru(tmp_path: Path) -> None:
+    cache = ResultCache(tmp_path / "results.json", max_entries=2)
+    cache.put("a", 1, 2)
+    cache.put("b", 3, 4)
+    assert cache.get("a") == (1, 2)
+
+    # "b" is now the least recently used
+    cache.put("c", 5, 6)
+    assert cache.get("b") is None
+    assert cache.get("a") == (1, 2)
+    assert cache.get("c") == (5, 6)
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_result_cache_persists(tmp_path: Path) -> None:
+    cache = ResultCache(tmp_path / "results.json")
+    cache.put("a", 1, 102.0)
+    assert cache.get("missing") is None
+    cache.save()
+
+    reloaded = ResultCache(tmp_path / "results.json")
+    assert reloaded.get("a") == (1, 102.0)
+    assert reloaded.lifetime_hits == 1
+    assert reloaded.lifetime_misses == 1
+
+
+def test_result_cache_key_changes_with_input(tmp_path: Path) -> None:
+    path = tmp_path / "input.txt"
+    path.write_text("1abc2\n")
+    first = ResultCache.key("day_1", str(path))
+    path.write_text("pqr3stu8vwx\n")
+    assert ResultCache.key("day_1", str(path)) != first
@@ -1,5 +1,15 @@
 from collections.abc import Iterator
-from aoc.utils.common import Coord, a_star
+from aoc.utils.common import (
+    Coord,
+    Direction,
+    Packer,
+    SearchStats,
+    a_star,
+    a_star_cost,
+    collect_search_stats,
+    lower_bound_table,
+    search,
+)
 
 import pytest
 
@@ -56,3 +66,117 @@ def test_a_star(
 
     assert cost == expected_cost
     assert path == expected_path
+
+
+def test_a_star_reopens() -> None:
+    # S -1-> A -1-> B -3-> G, and S -3-> B. The estimate at A is admissible but
+    # not consistent, so B is expanded through the dearer edge first and has to
+    # be expanded again once A turns up the cheaper way to it.
+    edges = {"S": {"A": 1.0, "B": 3.0}, "A": {"B": 1.0}, "B": {"G": 3.0}, "G": {}}
+    estimates = {"S": 0.0, "A": 4.0, "B": 0.0, "G": 0.0}
+
+    def heuristic(current: str, goal: str) -> float:
+        return estimates[current]
+
+    def cost_func(paths: dict[str, str], current: str, last: str) -> float:
+        return edges[last][current]
+
+    def neighbor(current: str, paths: dict[str, str]) -> Iterator[str]:
+        yield from edges[current]
+
+    assert a_star("S", "G", heuristic, cost_func, neighbor) == (
+        ["S", "A", "B", "G"],
+        5.0,
+    )
+    result = search(
+        ["S"], {"G"}, cost_func, neighbor, estimates.__getitem__, reopen=True
+    )
+    assert result.cost == 5.0
+
+
+def test_packer() -> None:
+    packer = Packer(10)
+    packed = packer.pack(Coord(3, 4))
+    assert packer.unpack(packed) == Coord(3, 4)
+    assert packer.unpack(packer.add(packed, Direction.NORTH)) == Coord(3, 3)
+    assert [packer.unpack(n) for n in packer.neighbors(packed)] == [
+        Coord(3, 3),
+        Coord(4, 4),
+        Coord(3, 5),
+        Coord(2, 4),
+    ]
+    assert packer.in_bounds(packed, 5)
+    assert not packer.in_bounds(packed, 4)
+
+
+@pytest.mark.parametrize("int_costs", [False, True])
+def test_a_star_cost(int_costs: bool) -> None:
+    # A 5x5 room where every step costs 1, apart from a wall of 20s across the
+    # middle row with a single gap at the far right
+    def cost_func(paths: dict[Coord, Coord], current: Coord, last: Coord) -> float:
+        return 20.0 if current.y == 2 and current.x < 4 else 1.0
+
+    def heuristic(current: Coord, goal: Coord) -> float:
+        return abs(current.x - goal.x) + abs(current.y - goal.y)
+
+    def neighbor(current: Coord, paths: dict[Coord, Coord]) -> Iterator[Coord]:
+        for direction in Direction:
+            next_coord = current.add(direction.value)
+            if 0 <= next_coord.x < 5 and 0 <= next_coord.y < 5:
+                yield next_coord
+
+    cost = a_star_cost(
+        Coord(0, 0), Coord(0, 4), heuristic, cost_func, neighbor, int_costs
+    )
+    assert cost == 12
+
+
+def test_search_many_starts_and_goals() -> None:
+    # Walking a number line one step at a time
+    def cost_func(paths: dict[int, int], current: int, last: int) -> float:
+        return 1.0
+
+    def neighbor(current: int, paths: dict[int, int]) -> Iterator[int]:
+        yield current - 1
+        yield current + 1
+
+    result = search([0, 10], {4, 13}, cost_func, neighbor, with_path=True)
+    assert result == (13, 3.0, [10, 11, 12, 13])
+
+    result = search([0], lambda n: n % 7 == 6, cost_func, neighbor, int_costs=True)
+    assert (result.goal, result.cost, result.path) == (-1, 1.0, None)
+
+
+def test_search_stats() -> None:
+    def cost_func(paths: dict[int, int], current: int, last: int) -> float:
+        return 1.0
+
+    def neighbor(current: int, paths: dict[int, int]) -> Iterator[int]:
+        yield current - 1
+        yield current + 1
+
+    stats = SearchStats()
+    search([0], {3}, cost_func, neighbor, stats=stats)
+    # Ties go to the lower number, so everything from -3 to 2 gets expanded
+    # before 3 is popped
+    assert stats.expansions == 6
+    assert stats.pushes == stats.heuristic_calls == 8
+    assert stats.neighbor_calls == 6
+
+    with collect_search_stats() as collected:
+        search([0], {3}, cost_func, neighbor)
+        search([0], {3}, cost_func, neighbor)
+    assert collected.searches == 2
+    assert collected.expansions == 12
+
+
+def test_lower_bound_table() -> None:
+    # 1 9 1
+    # 1 9 1
+    # 1 1 1
+    cells = [1, 9, 1, 1, 9, 1, 1, 1, 1]
+    table = lower_bound_table(cells, 3, [2])
+    assert table[2] == 0
+    # Round the bottom is cheaper than through the 9s
+    assert table[0] == 1 + 1 + 1 + 1 + 1 + 1
+    assert table[1] == 1
@@ -0,0 +1,67 @@
+from pathlib import Path
+
+import pytest
+
+from aoc.utils.contents import PuzzleStream, get_puzzle_input
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_get_puzzle_input(tmp_path: Path, use_mmap: bool) -> None:
+    path = tmp_path / "input.txt"
+    path.write_text("467..114..\n  ...*......\n\n..35..633.\n")
+
+    puzzle = get_puzzle_input(str(path), use_mmap)
+
+    assert puzzle.raw == "467..114..\n  ...*......\n\n..35..633.\n"
+    assert puzzle.lines == ["467..114..", "...*......", "", "..35..633."]
+    assert puzzle.view[:3].tobytes() == b"467"
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_get_empty_puzzle_input(tmp_path: Path, use_mmap: bool) -> None:
+    path = tmp_path / "input.txt"
+    path.write_text("")
+
+    puzzle = get_puzzle_input(str(path), use_mmap)
+
+    assert puzzle.raw == ""
+    assert puzzle.lines == []
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1 << 16])
+def test_puzzle_stream(tmp_path: Path, chunk_size: int) -> None:
+    path = tmp_path / "input.txt"
+    path.write_text("467..114..\n  ...*......\n\n..35..633.\n")
+
+    stream = PuzzleStream(str(path), chunk_size)
+
+    assert list(stream.lines) == get_puzzle_input(str(path)).lines
+    # Every pass reads the file again
+    assert list(stream.lines) == ["467..114..", "...*......", "", "..35..633."]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1 << 16])
+def test_puzzle_stream_records(tmp_path: Path, chunk_size: int) -> None:
+    path = tmp_path / "input.txt"
+    path.write_text("rn=1,cm-,qp=3,pc-\n")
+
+    stream = PuzzleStream(str(path), chunk_size)
+
+    assert list(stream.records(",")) == ["rn=1", "cm-", "qp=3", "pc-"]
+    assert list(get_puzzle_input(str(path)).records(",")) == list(stream.records(","))
+
+    path.write_text("ab\n\ncd\n\nef\n")
+
+    assert list(stream.records("\n\n")) == ["ab", "cd", "ef"]
+    assert list(get_puzzle_input(str(path)).records("\n\n")) == ["ab", "cd", "ef"]
+
+
+@pytest.mark.parametrize("size", [1, 4, 12, 1 << 16])
+def test_chunks(tmp_path: Path, size: int) -> None:
+    path = tmp_path / "input.txt"
+    path.write_text("467..114..\n...*......\n\n..35..633.")
+
+    for puzzle in (get_puzzle_input(str(path)), PuzzleStream(str(path))):
+        chunks = list(puzzle.chunks(size))
+        assert b"".join(chunks) == path.read_bytes()
+        assert all(chunk.endswith(b"\n") for chunk in chunks[:-1])
@@ -0,0 +1,24 @@
+from aoc.utils.common import Coord, Direction
+from aoc.utils.grid import Grid
+
+
+def test_from_lines_pads_with_sentinel() -> None:
+    grid = Grid.from_lines(["ab", "cd"], padding=1, sentinel="#")
+    assert grid.lines() == ["ab", "cd"]
+    assert grid.get(1, 1) == "d"
+    assert chr(grid[grid.index(0, 0) + grid.orthogonal[0]]) == "#"
+    assert chr(grid[grid.index(1, 0) + grid.offset(Direction.EAST)]) == "#"
+
+
+def test_find_and_coord() -> None:
+    grid = Grid.from_lines(["...", ".S."], padding=2)
+    assert grid.coord(grid.find("S")) == Coord(1, 1)
+
+
+def test_transpose_shares_cells() -> None:
+    grid = Grid.from_lines(["abc", "def"])
+    flipped = grid.transpose()
+    assert flipped.lines() == ["ad", "be", "cf"]
+    assert flipped.coord(flipped.index(1, 2)) == Coord(1, 2)
+    flipped.row(0)[1] = ord("x")
+    assert grid.lines() == ["abc", "xef"]
@@ -0,0 +1,38 @@
+import math
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from aoc.utils import parallel
+
+
+def test_map_reduce_serial() -> None:
+    assert parallel.map_reduce(abs, range(-10, 10)) == 100
+    assert parallel.map_reduce(abs, [], initial=7) == 7
+
+
+def test_map_reduce_pool(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Make even this little work worth spreading out, over several chunks
+    monkeypatch.setattr(parallel, "MIN_PARALLEL_TIME", 0)
+    monkeypatch.setattr(parallel, "CHUNK_TIME", 1e-4)
+    records = list(range(-5000, 5000))
+    assert parallel.map_reduce(abs, records, workers=2) == 25_000_000
+    assert parallel.map_reduce(abs, records, min, math.inf, workers=2) == 0
+
+
+def test_in_flight_streams() -> None:
+    pulled = 0
+
+    def chunks() -> Iterator[list[int]]:
+        nonlocal pulled
+        for i in range(100):
+            pulled += 1
+            yield [i, i]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = parallel._in_flight(executor, sum, chunks(), 4)
+        for finished, _ in enumerate(results, 1):
+            # Never more than 4 handed over and not yet finished
+            assert pulled <= finished + 4 - 1
+    assert pulled == finished == 100
@@ -0,0 +1,25 @@
+from array import array
+
+from aoc.utils.parsing import Format, int_array, ints
+
+
+def test_ints() -> None:
+    assert ints("Time: 7 -15  30") == [7, -15, 30]
+    assert ints(b"1,2\n-3") == [1, 2, -3]
+    assert ints("no numbers") == []
+
+
+def test_int_array() -> None:
+    assert int_array(memoryview(b"19, 13 @ -2,  1")) == array("q", [19, 13, -2, 1])
+    # Dashes that aren't minus signs take the slow way round
+    assert int_array("seed-to-soil map:\n50 98 2") == array("q", [50, 98, 2])
+
+
+def test_format() -> None:
+    node = Format("{} = ({}, {})")
+    assert node.parse("AAA = (BBB, CCC)") == ("AAA", "BBB", "CCC")
+    assert node.parse("AAA = (BBB, CCC) extra") is None
+
+    red = Format("{:d} red")
+    assert red.search(" 3 blue, 12 red") == (12,)
+    assert red.search(" 3 blue") is None
@@ -0,0 +1,30 @@
+import sys
+
+import pytest
+
+from aoc.utils import registry
+
+
+def test_available_days() -> None:
+    days = registry.available_days()
+    assert days[0] == "day_1"
+    assert days[-1] == "day_25"
+    assert len(days) == 25
+
+
+@pytest.mark.parametrize("day, expected", [("3", "day_3"), ("day_3", "day_3")])
+def test_normalize_day(day: str, expected: str) -> None:
+    assert registry.normalize_day(day) == expected
+
+
+def test_load_day_only_imports_requested() -> None:
+    sys.modules.pop("aoc.day_9", None)
+    sys.modules.pop("aoc.day_10", None)
+    module = registry.load_day("day_9")
+    assert module.__name__ == "aoc.day_9"
+    assert "aoc.day_10" not in sys.modules
+
+
+def test_load_unknown_day() -> None:
+    with pytest.raises(ValueError):
+        registry.load_day("day_26")
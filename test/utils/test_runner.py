@@ -0,0 +1,14 @@
+from aoc.utils import runner
+
+
+def test_schedule_longest_first() -> None:
+    timings = {"day_1": 0.1, "day_5": 30.0, "day_9": 1.0}
+    order = runner.schedule(["day_1", "day_5", "day_7", "day_9"], timings)
+    assert order == ["day_7", "day_5", "day_9", "day_1"]
+
+
+def test_run_day() -> None:
+    result = runner.run_day("day_2", test=True)
+    assert result.part_1 == 8
+    assert result.part_2 == 2286
+    assert result.error is None